@@ -79,6 +79,47 @@ class QueryResult:
         PostgreSQL Type which isn't supported, read more in our docs.
         """
 
+    def row_count(self: Self) -> int:
+        """Return number of rows in the result.
+
+        Rows are not converted into Python objects,
+        so it is cheaper than `len(result.result())`.
+        """
+
+    def columns(
+        self: Self,
+        custom_decoders: dict[str, Callable[[bytes], Any]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Return result as a dict of column name to list of column values.
+
+        Values are converted column by column,
+        it's useful when the result is processed per column,
+        for example validated with `TypeAdapter(list[T])`.
+
+        ### Parameters:
+        - `custom_decoders`: functions for custom decoding.
+        """
+
+    def value(
+        self: Self,
+        row: int = 0,
+        column: int = 0,
+        custom_decoders: dict[str, Callable[[bytes], Any]] | None = None,
+    ) -> Any:
+        """Return one value from the result by row and column index.
+
+        Only the requested value is converted into Python object,
+        so it is cheaper than `result()[row][column_name]`.
+
+        ### Parameters:
+        - `row`: index of the row.
+        - `column`: index of the column in the row.
+        - `custom_decoders`: functions for custom decoding.
+
+        ### Raises:
+        - `IndexError`: if row or column index is out of range.
+        """
+
     def as_class(
         self: Self,
         as_class: Callable[..., _CustomClass],
@@ -419,6 +460,30 @@ class Transaction:
         `begin()` can be called only once per transaction.
         """
 
+    async def begin_with(
+        self: Self,
+        querystring: str,
+        parameters: ParamsT = None,
+        prepared: bool = True,
+    ) -> QueryResult:
+        """Start the transaction and execute the first query.
+
+        `BEGIN` and the query are sent together,
+        without waiting for `BEGIN` to complete first.
+
+        `begin_with()` can be called only once per transaction
+        and replaces `begin()`.
+        If the transaction can't be started, `TransactionBeginError`
+        is raised and its message says whether the query
+        was executed outside of the transaction.
+
+        ### Parameters:
+        - `querystring`: querystring to execute.
+        - `parameters`: list of parameters to pass in the query.
+        - `prepared`: should the querystring be prepared before the request.
+            By default any querystring will be prepared.
+        """
+
     async def commit(self: Self) -> None:
         """Commit the transaction.
 
@@ -507,6 +572,7 @@ class Transaction:
         querystring: str,
         parameters: Sequence[Sequence[Any]] | None = None,
         prepared: bool = True,
+        fast_executemany: bool = False,
     ) -> None: ...
     """Execute query multiple times with different parameters.
 
@@ -518,6 +584,10 @@ class Transaction:
         - `parameters`: list of list of parameters to pass in the query.
         - `prepared`: should the querystring be prepared before the request.
             By default any querystring will be prepared.
+        - `fast_executemany`: send all parameters in one multi-row
+            `INSERT ... VALUES (...), (...)` statement.
+            Works only for plain `INSERT ... VALUES (...)` querystrings,
+            any other querystring is executed as usual.
 
         ### Example:
         ```python
@@ -787,6 +857,36 @@ class Transaction:
         ```
         """
 
+    def savepoint_scope(self: Self, savepoint_name: str) -> SavepointScope:
+        """Create new savepoint scope.
+
+        It must be used as an async context manager.
+        `SAVEPOINT` is sent together with the first query
+        executed through the scope, on exit the savepoint
+        is released or, if an exception was raised,
+        rolled back to and released.
+
+        Only queries executed with the scope's `execute`
+        are covered by the savepoint.
+
+        ### Parameters:
+        - `savepoint_name`: name of the SAVEPOINT.
+
+        ### Example:
+        ```python
+        import asyncio
+
+        from psqlpy import PSQLPool, QueryResult
+
+        async def main() -> None:
+            db_pool = PSQLPool()
+            connection = await db_pool.connection()
+            async with connection.transaction() as transaction:
+                async with transaction.savepoint_scope("my_savepoint") as sp:
+                    await sp.execute(...)
+        ```
+        """
+
     def cursor(
         self: Self,
         querystring: str,
@@ -997,6 +1097,7 @@ class Connection:
         querystring: str,
         parameters: list[list[Any]] | None = None,
         prepared: bool = True,
+        fast_executemany: bool = False,
     ) -> None: ...
     """Execute query multiple times with different parameters.
 
@@ -1008,6 +1109,10 @@ class Connection:
         - `parameters`: list of list of parameters to pass in the query.
         - `prepared`: should the querystring be prepared before the request.
             By default any querystring will be prepared.
+        - `fast_executemany`: send all parameters in one multi-row
+            `INSERT ... VALUES (...), (...)` statement.
+            Works only for plain `INSERT ... VALUES (...)` querystrings,
+            any other querystring is executed as usual.
 
         ### Example:
         ```python
@@ -1951,9 +2056,49 @@ class Column:
     name: str
     table_oid: int | None
 
+class SavepointScope:
+    """Savepoint inside a transaction.
+
+    You can create it only from `Transaction` with method
+    `.savepoint_scope()`.
+    """
+
+    async def __aenter__(self: Self) -> Self: ...
+    async def __aexit__(
+        self: Self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None: ...
+    async def execute(
+        self: Self,
+        querystring: str,
+        parameters: ParamsT = None,
+        prepared: bool = True,
+    ) -> QueryResult:
+        """Execute the query inside the savepoint.
+
+        The first call sends `SAVEPOINT` together with the query.
+
+        ### Parameters:
+        - `querystring`: querystring to execute.
+        - `parameters`: list of parameters to pass in the query.
+        - `prepared`: should the querystring be prepared before the request.
+            By default any querystring will be prepared.
+        """
+
 class PreparedStatement:
-    async def execute(self: Self) -> QueryResult:
-        """Execute prepared statement."""
+    async def execute(
+        self: Self,
+        parameters: ParamsT = None,
+    ) -> QueryResult:
+        """Execute prepared statement.
+
+        ### Parameters:
+        - `parameters`: new parameters for the statement.
+            If not passed, parameters from `prepare` are used.
+            Statement is not prepared again.
+        """
 
     def cursor(self: Self) -> Cursor:
         """Create new server-side cursor based on prepared statement."""
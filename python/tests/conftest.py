@@ -1,10 +1,17 @@
 import os
 import random
-from collections.abc import AsyncGenerator
+import sys
+from collections.abc import AsyncGenerator, Generator
 from urllib import parse
 
 import pytest
-from psqlpy import ConnectionPool, Cursor
+from psqlpy import (
+    Connection,
+    ConnectionPool,
+    ConnRecyclingMethod,
+    Cursor,
+    Transaction,
+)
 from psqlpy._internal import SslMode
 from pydantic import BaseModel
 
@@ -24,42 +31,45 @@ class DefaultPythonModelClass:
         self.name = name
 
 
-@pytest.fixture
-def anyio_backend() -> str:
+@pytest.fixture(scope="session")
+def anyio_backend() -> tuple[str, dict[str, bool]]:
     """
     Anyio backend.
 
     Backend for anyio pytest plugin.
-    :return: backend name.
+    Session scoped, so all tests run in one event loop.
+    asyncio runs on top of uvloop where it is available,
+    uvloop doesn't support Windows.
+    :return: backend name and its options.
     """
-    return "asyncio"
+    return "asyncio", {"use_uvloop": sys.platform != "win32"}
 
 
 def random_string(length: int = 10) -> str:
     return "".join(random.choice("AbCdEfG") for _ in range(length))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_host() -> str:
     return os.environ.get("POSTGRES_HOST", "localhost")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_user() -> str:
     return os.environ.get("POSTGRES_USER", "postgres")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_password() -> str:
     return os.environ.get("POSTGRES_PASSWORD", "postgres")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_port() -> int:
     return int(os.environ.get("POSTGRES_PORT", "5432"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_dbname() -> str:
     return os.environ.get("POSTGRES_DBNAME", "psqlpy_test")
 
@@ -103,14 +113,62 @@ def ssl_cert_file() -> str:
     )
 
 
+async def rollback_idle_connections(pool: ConnectionPool) -> None:
+    """
+    Roll back everything left on idle connections of the pool.
+
+    The pool doesn't clean connections up on return,
+    so a test that failed inside a transaction would hand
+    an open or aborted transaction to the next test.
+    """
+    idle_connections = [await pool.connection() for _ in range(pool.status().available)]
+    for connection in idle_connections:
+        await connection.execute_batch("ROLLBACK")
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def psql_pool(
+    postgres_host: str,
+    postgres_user: str,
+    postgres_password: str,
+    postgres_port: int,
+    postgres_dbname: str,
+) -> Generator[ConnectionPool, None, None]:
+    """
+    Connection pool shared by all tests in the session.
+
+    Connections are reused between tests, idle ones are rolled back
+    after every test by `create_default_data_for_tests`.
+    Connections are also cleaned up on every checkout,
+    so one returned later in an aborted transaction is replaced.
+    Tests must not rely on a fresh pool state, use `fresh_psql_pool` for that.
+    """
+    pool = ConnectionPool(
+        username=postgres_user,
+        password=postgres_password,
+        host=postgres_host,
+        port=postgres_port,
+        db_name=postgres_dbname,
+        conn_recycling_method=ConnRecyclingMethod.Clean,
+    )
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
-async def psql_pool(
+def fresh_psql_pool(
     postgres_host: str,
     postgres_user: str,
     postgres_password: str,
     postgres_port: int,
     postgres_dbname: str,
 ) -> ConnectionPool:
+    """
+    Connection pool for a single test.
+
+    Use it for assertions on the pool status.
+    """
     return ConnectionPool(
         username=postgres_user,
         password=postgres_password,
@@ -160,12 +218,56 @@ async def create_default_data_for_tests(
 
     yield
 
+    await rollback_idle_connections(psql_pool)
     async with psql_pool.acquire() as connection:
         await connection.execute(
-            f"DROP TABLE {table_name}",
+            f"DROP TABLE IF EXISTS {table_name}",
         )
 
 
+@pytest.fixture
+async def conn(
+    psql_pool: ConnectionPool,
+) -> AsyncGenerator[Connection, None]:
+    """Connection acquired from `psql_pool` for the whole test."""
+    async with psql_pool.acquire() as connection:
+        yield connection
+
+
+@pytest.fixture
+async def other_conn(
+    psql_pool: ConnectionPool,
+) -> AsyncGenerator[Connection, None]:
+    """Second connection to check what other sessions can see."""
+    async with psql_pool.acquire() as connection:
+        yield connection
+
+
+@pytest.fixture(scope="module")
+async def module_conn(
+    psql_pool: ConnectionPool,
+) -> AsyncGenerator[Connection, None]:
+    """
+    Connection shared by all tests of one module.
+
+    Use it for read-only queries in heavily parametrized tests,
+    so every case doesn't check out a connection from the pool.
+    """
+    async with psql_pool.acquire() as connection:
+        yield connection
+
+
+@pytest.fixture
+async def rolled_back_transaction(
+    conn: Connection,
+) -> Transaction:
+    """Transaction that is already started and rolled back."""
+    transaction = conn.transaction()
+    await transaction.begin()
+    await transaction.rollback()
+    return transaction
+
+
 @pytest.fixture
 async def create_table_for_listener_tests(
     psql_pool: ConnectionPool,
@@ -27,7 +27,7 @@ async def test_connection_execute(
         querystring=f"SELECT * FROM {table_name}",
     )
     assert isinstance(conn_result, QueryResult)
-    assert len(conn_result.result()) == number_database_records
+    assert conn_result.row_count() == number_database_records
 
 
 async def test_connection_fetch(
@@ -42,7 +42,7 @@ async def test_connection_fetch(
         querystring=f"SELECT * FROM {table_name}",
     )
     assert isinstance(conn_result, QueryResult)
-    assert len(conn_result.result()) == number_database_records
+    assert conn_result.row_count() == number_database_records
 
 
 async def test_connection_connection(
@@ -150,21 +150,21 @@ async def test_connection_cursor(
 
 
 async def test_connection_async_context_manager(
-    psql_pool: ConnectionPool,
+    fresh_psql_pool: ConnectionPool,
     table_name: str,
     number_database_records: int,
 ) -> None:
     """Test connection as a async context manager."""
-    async with psql_pool.acquire() as connection:
+    async with fresh_psql_pool.acquire() as connection:
         conn_result = await connection.execute(
             querystring=f"SELECT * FROM {table_name}",
         )
-        assert not psql_pool.status().available
+        assert not fresh_psql_pool.status().available
 
-    assert psql_pool.status().available == 1
+    assert fresh_psql_pool.status().available == 1
 
     assert isinstance(conn_result, QueryResult)
-    assert len(conn_result.result()) == number_database_records
+    assert conn_result.row_count() == number_database_records
 
 
 async def test_closed_connection_error(
@@ -245,6 +245,61 @@ async def test_copy_records_heterogeneous_types(
             await connection.execute(f"DROP TABLE IF EXISTS {target}")
 
 
+async def test_copy_records_numeric_arrays(
+    psql_pool: ConnectionPool,
+) -> None:
+    """Array-heavy rows, e.g. embedding vectors, go through binary COPY as is."""
+    target: typing.Final = "copy_records_arrays"
+    dimension: typing.Final = 1536
+
+    async with psql_pool.acquire() as connection:
+        await connection.execute_batch(
+            f"DROP TABLE IF EXISTS {target};"
+            f"""
+            CREATE TABLE {target} (
+                id          INTEGER,
+                embedding   FLOAT8[],
+                counters    INT8[],
+                prices      NUMERIC[],
+                ids         UUID[]
+            )
+            """,
+        )
+
+    try:
+        sample_uuid = uuid.uuid4()
+        records = [
+            (
+                row_id,
+                [row_id + index / dimension for index in range(dimension)],
+                [row_id, 2**40],
+                [Decimal("1.5"), Decimal("2.25")],
+                [sample_uuid, sample_uuid],
+            )
+            for row_id in range(3)
+        ]
+
+        async with psql_pool.acquire() as connection:
+            inserted = await connection.copy_records_to_table(
+                table_name=target,
+                records=records,
+            )
+
+        assert inserted == len(records)
+
+        async with psql_pool.acquire() as connection:
+            result = await connection.execute(
+                f"SELECT * FROM {target} ORDER BY id",
+            )
+        for record, row in zip(records, result.result(), strict=True):
+            assert row["embedding"] == record[1]
+            assert row["counters"] == record[2]
+            assert row["prices"] == record[3]
+            assert row["ids"] == [str(sample_uuid), str(sample_uuid)]
+    finally:
+        await _drop_target_table(psql_pool, target)
+
+
 async def test_copy_records_introspection_cache(
     psql_pool: ConnectionPool,
 ) -> None:
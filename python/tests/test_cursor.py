@@ -16,14 +16,14 @@ async def test_cursor_fetchmany(
 ) -> None:
     """Test cursor fetch with custom number of fetch."""
     result = await test_cursor.fetchmany(size=number_database_records // 2)
-    assert len(result.result()) == number_database_records // 2
+    assert result.row_count() == number_database_records // 2
 
 
 async def test_cursor_fetchone(
     test_cursor: Cursor,
 ) -> None:
     result = await test_cursor.fetchone()
-    assert len(result.result()) == 1
+    assert result.row_count() == 1
 
 
 async def test_cursor_fetchall(
@@ -31,7 +31,7 @@ async def test_cursor_fetchall(
     test_cursor: Cursor,
 ) -> None:
     result = await test_cursor.fetchall()
-    assert len(result.result()) == number_database_records
+    assert result.row_count() == number_database_records
 
 
 async def test_cursor_start(
@@ -46,7 +46,7 @@ async def test_cursor_start(
     await cursor.start()
     results = await cursor.fetchall()
 
-    assert len(results.result()) == number_database_records
+    assert results.row_count() == number_database_records
 
     cursor.close()
 
@@ -62,7 +62,7 @@ async def test_cursor_as_async_context_manager(
     ) as cursor:
         results = await cursor.fetchall()
 
-    assert len(results.result()) == number_database_records
+    assert results.row_count() == number_database_records
 
 
 async def test_cursor_as_async_iterator(
@@ -82,34 +82,34 @@ async def test_cursor_as_async_iterator(
 
 
 async def test_cursor_send_underlying_connection_to_pool(
-    psql_pool: ConnectionPool,
+    fresh_psql_pool: ConnectionPool,
     table_name: str,
 ) -> None:
     """Test send underlying connection to the pool."""
-    async with psql_pool.acquire() as connection:
+    async with fresh_psql_pool.acquire() as connection:
         async with connection.transaction() as transaction:
             async with transaction.cursor(
                 querystring=f"SELECT * FROM {table_name}",
             ) as cursor:
                 await cursor.fetchmany(10)
-                assert not psql_pool.status().available
-            assert not psql_pool.status().available
-        assert not psql_pool.status().available
-    assert psql_pool.status().available == 1
+                assert not fresh_psql_pool.status().available
+            assert not fresh_psql_pool.status().available
+        assert not fresh_psql_pool.status().available
+    assert fresh_psql_pool.status().available == 1
 
 
 async def test_cursor_send_underlying_connection_to_pool_manually(
-    psql_pool: ConnectionPool,
+    fresh_psql_pool: ConnectionPool,
     table_name: str,
 ) -> None:
     """Test send underlying connection to the pool."""
-    async with psql_pool.acquire() as connection:
+    async with fresh_psql_pool.acquire() as connection:
         async with connection.transaction() as transaction:
             cursor = transaction.cursor(querystring=f"SELECT * FROM {table_name}")
             await cursor.start()
             await cursor.fetchmany(10)
-            assert not psql_pool.status().available
+            assert not fresh_psql_pool.status().available
             cursor.close()
-            assert not psql_pool.status().available
-        assert not psql_pool.status().available
-    assert psql_pool.status().available == 1
+            assert not fresh_psql_pool.status().available
+        assert not fresh_psql_pool.status().available
+    assert fresh_psql_pool.status().available == 1
@@ -42,6 +42,69 @@ async def test_result_as_tuple(
     assert single_tuple_row[0] == 1
 
 
+async def test_result_row_count(
+    psql_pool: ConnectionPool,
+    table_name: str,
+    number_database_records: int,
+) -> None:
+    """Test that result returns number of rows."""
+    connection = await psql_pool.connection()
+
+    conn_result = await connection.execute(
+        querystring=f"SELECT * FROM {table_name}",
+    )
+    empty_result = await connection.execute(
+        querystring=f"SELECT * FROM {table_name} WHERE id < 0",
+    )
+
+    assert conn_result.row_count() == number_database_records
+    assert empty_result.row_count() == 0
+
+
+async def test_result_columns(
+    psql_pool: ConnectionPool,
+    table_name: str,
+    number_database_records: int,
+) -> None:
+    """Test that result can be returned column by column."""
+    connection = await psql_pool.connection()
+
+    conn_result = await connection.execute(
+        querystring=f"SELECT id, name FROM {table_name} ORDER BY id",
+    )
+    empty_result = await connection.execute(
+        querystring=f"SELECT id, name FROM {table_name} WHERE id < 0",
+    )
+    columns = conn_result.columns()
+
+    assert list(columns) == ["id", "name"]
+    assert columns["id"] == list(range(1, number_database_records + 1))
+    assert columns["name"] == [row["name"] for row in conn_result.result()]
+    assert empty_result.columns() == {}
+
+
+async def test_result_value(
+    psql_pool: ConnectionPool,
+    table_name: str,
+) -> None:
+    """Test that result returns one value by row and column index."""
+    connection = await psql_pool.connection()
+
+    conn_result = await connection.execute(
+        querystring=f"SELECT id, name FROM {table_name} ORDER BY id",
+    )
+    rows = conn_result.result(as_tuple=True)
+
+    assert conn_result.value() == rows[0][0]
+    assert conn_result.value(row=1, column=1) == rows[1][1]
+
+    with pytest.raises(IndexError):
+        conn_result.value(row=conn_result.row_count())
+
+    with pytest.raises(IndexError):
+        conn_result.value(column=2)
+
+
 async def test_single_result_as_dict(
     psql_pool: ConnectionPool,
     table_name: str,
@@ -4,14 +4,19 @@ import typing
 
 import pytest
 from psqlpy import (
+    Connection,
     ConnectionPool,
     Cursor,
     IsolationLevel,
     ReadVariant,
+    Transaction,
 )
 from psqlpy._internal.exceptions import TransactionClosedError
 from psqlpy.exceptions import (
+    ConnectionExecuteError,
+    DatabaseError,
     InterfaceError,
+    TransactionBeginError,
     TransactionExecuteError,
 )
 
@@ -77,52 +82,131 @@ async def test_transaction_begin(
         f"SELECT * FROM {table_name}",
     )
 
-    assert len(result.result()) == number_database_records
+    assert result.row_count() == number_database_records
 
     await transaction.commit()
 
 
 async def test_transaction_commit(
-    psql_pool: ConnectionPool,
+    conn: Connection,
+    other_conn: Connection,
     table_name: str,
 ) -> None:
     """Test that transaction commit command."""
-    connection = await psql_pool.connection()
-    transaction = connection.transaction()
-    await transaction.begin()
+    transaction = conn.transaction()
 
     test_name: str = "test_name"
-    await transaction.execute(
+    await transaction.begin_with(
         f"INSERT INTO {table_name} VALUES ($1, $2)",
         parameters=[100, test_name],
     )
 
     # Make request from other connection, it mustn't know
     # about new INSERT data before commit.
-    connection = await psql_pool.connection()
-    result = await connection.execute(
+    result = await other_conn.execute(
         f"SELECT * FROM {table_name} WHERE name = $1",
         parameters=[test_name],
     )
-    assert not result.result()
+    assert result.row_count() == 0
 
     await transaction.commit()
 
-    result = await connection.execute(
+    result = await other_conn.execute(
         f"SELECT * FROM {table_name} WHERE name = $1",
         parameters=[test_name],
     )
 
-    assert len(result.result())
+    assert result.row_count()
+
+
+async def test_transaction_begin_with_twice(
+    conn: Connection,
+    table_name: str,
+) -> None:
+    """Test that `begin_with` can't start already started transaction."""
+    transaction = conn.transaction()
+    await transaction.begin_with(f"SELECT * FROM {table_name}")
+
+    with pytest.raises(expected_exception=TransactionBeginError):
+        await transaction.begin_with(f"SELECT * FROM {table_name}")
+
+    await transaction.rollback()
+
+
+async def test_transaction_begin_with_failed_begin(
+    conn: Connection,
+    table_name: str,
+) -> None:
+    """Test that `begin_with` raises if the transaction can't be started."""
+    # Leave the session in an aborted transaction block,
+    # so any statement except ROLLBACK fails.
+    await conn.execute_batch("BEGIN")
+    with pytest.raises(expected_exception=ConnectionExecuteError):
+        await conn.execute(f"SELECT * FROM {table_name} WHERE id = 1 / (id - id)")
+
+    transaction = conn.transaction()
+    with pytest.raises(
+        expected_exception=TransactionBeginError,
+        match="query wasn't executed",
+    ):
+        await transaction.begin_with(f"SELECT * FROM {table_name}")
+
+    await conn.execute_batch("ROLLBACK")
+
+
+async def _insert_in_savepoint_scope(
+    transaction: Transaction,
+    table_name: str,
+    test_name: str,
+    failing_query: str | None = None,
+) -> None:
+    """Insert a row inside savepoint scope and leave it with an error.
+
+    If `failing_query` is passed, it's executed in the scope,
+    otherwise the scope body raises `ValueError`.
+    """
+    async with transaction.savepoint_scope("sp1") as savepoint:
+        await savepoint.execute(
+            f"INSERT INTO {table_name} VALUES ($1, $2)",
+            parameters=[100, test_name],
+        )
+        result = await savepoint.execute(
+            f"SELECT * FROM {table_name} WHERE name = $1",
+            parameters=[test_name],
+        )
+        assert result.row_count()
+        if failing_query is not None:
+            await savepoint.execute(failing_query)
+        raise ValueError("Savepoint scope body failed")
 
 
 async def test_transaction_savepoint(
-    psql_pool: ConnectionPool,
+    conn: Connection,
     table_name: str,
 ) -> None:
     """Test that it's possible to rollback to savepoint."""
-    connection = await psql_pool.connection()
-    transaction = connection.transaction()
+    test_name = "test_name"
+    async with conn.transaction() as transaction:
+        with pytest.raises(
+            expected_exception=ValueError,
+            match="Savepoint scope body failed",
+        ):
+            await _insert_in_savepoint_scope(transaction, table_name, test_name)
+
+        result = await transaction.execute(
+            f"SELECT * FROM {table_name} WHERE name = $1",
+            parameters=[test_name],
+        )
+        assert result.row_count() == 0
+
+
+async def test_transaction_rollback_savepoint(
+    conn: Connection,
+    other_conn: Connection,
+    table_name: str,
+) -> None:
+    """Test that it's possible to rollback to savepoint created by hand."""
+    transaction = conn.transaction()
     await transaction.begin()
 
     test_name = "test_name"
@@ -136,26 +220,70 @@ async def test_transaction_savepoint(
         f"SELECT * FROM {table_name} WHERE name = $1",
         parameters=[test_name],
     )
-    assert result.result()
+    assert result.row_count()
 
     await transaction.rollback_savepoint(savepoint_name=savepoint_name)
-    connection = await psql_pool.connection()
-    result = await connection.execute(
+    result = await other_conn.execute(
         f"SELECT * FROM {table_name} WHERE name = $1",
         parameters=[test_name],
     )
-    assert not len(result.result())
+    assert result.row_count() == 0
 
     await transaction.commit()
 
 
-async def test_transaction_rollback(
+async def test_transaction_savepoint_scope_failed_execute(
     psql_pool: ConnectionPool,
     table_name: str,
 ) -> None:
-    """Test that ROLLBACK works correctly."""
+    """Test that savepoint scope rolls back if a query in it fails."""
     connection = await psql_pool.connection()
-    transaction = connection.transaction()
+    test_name = "test_name"
+    async with connection.transaction() as transaction:
+        with pytest.raises(expected_exception=ConnectionExecuteError):
+            await _insert_in_savepoint_scope(
+                transaction,
+                table_name,
+                test_name,
+                failing_query=f"SELECT * FROM {table_name} WHERE id = 1 / (id - id)",
+            )
+
+        # Transaction is usable again after the scope is rolled back.
+        result = await transaction.execute(
+            f"SELECT * FROM {table_name} WHERE name = $1",
+            parameters=[test_name],
+        )
+        assert result.row_count() == 0
+
+
+async def test_transaction_savepoint_scope_release(
+    psql_pool: ConnectionPool,
+    table_name: str,
+) -> None:
+    """Test that savepoint scope keeps its queries on success."""
+    connection = await psql_pool.connection()
+    test_name = "test_name"
+    async with connection.transaction() as transaction:
+        async with transaction.savepoint_scope("sp1") as savepoint:
+            await savepoint.execute(
+                f"INSERT INTO {table_name} VALUES ($1, $2)",
+                parameters=[100, test_name],
+            )
+
+        result = await transaction.execute(
+            f"SELECT * FROM {table_name} WHERE name = $1",
+            parameters=[test_name],
+        )
+        assert result.row_count()
+
+
+async def test_transaction_rollback(
+    conn: Connection,
+    other_conn: Connection,
+    table_name: str,
+) -> None:
+    """Test that ROLLBACK works correctly."""
+    transaction = conn.transaction()
     await transaction.begin()
 
     test_name = "test_name"
@@ -168,7 +296,7 @@ async def test_transaction_rollback(
         f"SELECT * FROM {table_name} WHERE name = $1",
         parameters=[test_name],
     )
-    assert result.result()
+    assert result.row_count()
 
     await transaction.rollback()
 
@@ -178,14 +306,28 @@ async def test_transaction_rollback(
             parameters=[test_name],
         )
 
-    connection = await psql_pool.connection()
-    result_from_conn = await connection.execute(
+    result_from_conn = await other_conn.execute(
         f"INSERT INTO {table_name} VALUES ($1, $2)",
         parameters=[100, test_name],
     )
-    connection.close()
 
-    assert not (result_from_conn.result())
+    assert result_from_conn.row_count() == 0
+
+
+@pytest.mark.parametrize(
+    "method_name",
+    ["execute", "fetch", "fetch_row", "fetch_val"],
+)
+async def test_transaction_closed_after_rollback(
+    rolled_back_transaction: Transaction,
+    table_name: str,
+    method_name: str,
+) -> None:
+    """Test that no query can be executed after ROLLBACK."""
+    with pytest.raises(expected_exception=TransactionClosedError):
+        await getattr(rolled_back_transaction, method_name)(
+            f"SELECT * FROM {table_name}",
+        )
 
 
 async def test_transaction_release_savepoint(
@@ -208,6 +350,43 @@ async def test_transaction_release_savepoint(
     await transaction.release_savepoint(sp_name_1)
     await transaction.create_savepoint(sp_name_1)
 
+    await transaction.commit()
+
+
+async def test_transaction_savepoints_in_batch(
+    psql_pool: ConnectionPool,
+    table_name: str,
+) -> None:
+    """Test that savepoint commands can be sent in one round-trip."""
+    connection = await psql_pool.connection()
+    transaction = connection.transaction()
+    await transaction.begin()
+
+    await transaction.execute_batch(
+        "SAVEPOINT sp1;"
+        f"INSERT INTO {table_name} VALUES (100, 'in_sp1');"
+        "SAVEPOINT sp2;"
+        f"INSERT INTO {table_name} VALUES (101, 'in_sp2');"
+        "RELEASE SAVEPOINT sp2",
+    )
+    result = await transaction.execute(
+        f"SELECT * FROM {table_name} WHERE id >= 100",
+    )
+    assert result.row_count() == 2
+
+    # Both rows were inserted after sp1.
+    await transaction.rollback_savepoint("sp1")
+    result = await transaction.execute(
+        f"SELECT * FROM {table_name} WHERE id >= 100",
+    )
+    assert result.row_count() == 0
+
+    # sp2 was released in the batch.
+    with pytest.raises(expected_exception=DatabaseError):
+        await transaction.rollback_savepoint("sp2")
+
+    await transaction.rollback()
+
 
 async def test_transaction_cursor(
     psql_pool: ConnectionPool,
@@ -233,7 +412,7 @@ async def test_transaction_fetch(
         conn_result = await transaction.fetch(
             querystring=f"SELECT * FROM {table_name}",
         )
-    assert len(conn_result.result()) == number_database_records
+    assert conn_result.row_count() == number_database_records
 
 
 @pytest.mark.parametrize(
@@ -245,11 +424,13 @@ async def test_transaction_fetch(
         [],
     ],
 )
+@pytest.mark.parametrize("fast_executemany", [False, True])
 async def test_transaction_execute_many(
     psql_pool: ConnectionPool,
     table_name: str,
     number_database_records: int,
     insert_values: list[list[typing.Any]],
+    fast_executemany: bool,
 ) -> None:
     connection = await psql_pool.connection()
     async with connection.transaction() as transaction:
@@ -257,6 +438,7 @@ async def test_transaction_execute_many(
             await transaction.execute_many(
                 f"INSERT INTO {table_name} VALUES ($1, $2)",
                 insert_values,
+                fast_executemany=fast_executemany,
             )
         except TransactionExecuteError:
             assert not insert_values
@@ -267,6 +449,122 @@ async def test_transaction_execute_many(
             ) - number_database_records == len(insert_values)
 
 
+async def test_transaction_execute_many_fast_partial_chunk(
+    psql_pool: ConnectionPool,
+) -> None:
+    """Test `fast_executemany` with more rows than fit into one statement."""
+    columns_number = 1000
+    # Bind parameters limit allows 65 rows of 1000 parameters in one statement,
+    # so rows are sent as two full statements and one partial.
+    rows_number = 150
+    columns = ", ".join(f"c{idx} INT" for idx in range(columns_number))
+    placeholders = ", ".join(f"${idx + 1}" for idx in range(columns_number))
+    connection = await psql_pool.connection()
+    async with connection.transaction() as transaction:
+        await transaction.execute(
+            f"CREATE TEMPORARY TABLE wide_table ({columns}) ON COMMIT DROP",
+        )
+        await transaction.execute_many(
+            f"INSERT INTO wide_table VALUES ({placeholders})",
+            [[row_idx] * columns_number for row_idx in range(rows_number)],
+            fast_executemany=True,
+        )
+
+        assert (
+            await transaction.fetch_val("SELECT COUNT(*) FROM wide_table")
+            == rows_number
+        )
+        # Only the full-chunk statement stays prepared.
+        assert (
+            await transaction.fetch_val(
+                "SELECT COUNT(*) FROM pg_prepared_statements "
+                "WHERE statement LIKE 'INSERT INTO wide_table%'",
+            )
+            == 1
+        )
+
+
+async def test_transaction_insert_unnest(
+    psql_pool: ConnectionPool,
+    table_name: str,
+    number_database_records: int,
+) -> None:
+    """Test that several rows can be inserted with a single query via `unnest`."""
+    cases: typing.Final = [
+        [[1, "name1"], [2, "name2"]],
+        [[10, "name1"], [20, "name2"], [30, "name3"]],
+        [[1, "name1"]],
+        [],
+    ]
+    connection = await psql_pool.connection()
+    async with connection.transaction() as transaction:
+        inserted_rows = 0
+        for insert_values in cases:
+            await transaction.execute(
+                f"INSERT INTO {table_name} (id, name) "
+                "SELECT * FROM unnest($1::int4[], $2::varchar[])",
+                parameters=[
+                    [row_id for row_id, _ in insert_values],
+                    [name for _, name in insert_values],
+                ],
+            )
+            inserted_rows += len(insert_values)
+            assert await count_rows_in_test_table(
+                table_name,
+                transaction,
+            ) - number_database_records == inserted_rows
+
+
+@pytest.mark.parametrize(
+    ("insert_values"),
+    [
+        [[1, "name1"], [2, "name2"]],
+        [[10, "name1"], [20, "name2"], [30, "name3"]],
+    ],
+)
+async def test_transaction_copy_records_bulk_insert(
+    psql_pool: ConnectionPool,
+    table_name: str,
+    number_database_records: int,
+    insert_values: list[list[typing.Any]],
+) -> None:
+    """Test that bulk insert through binary COPY inserts all records."""
+    connection = await psql_pool.connection()
+    async with connection.transaction() as transaction:
+        inserted = await transaction.copy_records_to_table(
+            table_name=table_name,
+            records=insert_values,
+            columns=["id", "name"],
+        )
+        assert inserted == len(insert_values)
+        assert await count_rows_in_test_table(
+            table_name,
+            transaction,
+        ) - number_database_records == len(insert_values)
+
+
+async def test_transaction_prepared_statement_new_parameters(
+    psql_pool: ConnectionPool,
+    table_name: str,
+    number_database_records: int,
+) -> None:
+    """Test that prepared statement can be executed with new parameters."""
+    connection = await psql_pool.connection()
+    async with connection.transaction() as transaction:
+        prepared_stmt = await transaction.prepare(
+            f"INSERT INTO {table_name} VALUES ($1, $2)",
+            parameters=[100, "test_name"],
+        )
+        await prepared_stmt.execute()
+        await prepared_stmt.execute(parameters=[101, "other_name"])
+
+        result = await transaction.execute(
+            f"SELECT * FROM {table_name} WHERE id > $1",
+            parameters=[number_database_records],
+        )
+        assert result.row_count() == 2
+
+
 async def test_transaction_fetch_row(
     psql_pool: ConnectionPool,
     table_name: str,
@@ -321,38 +619,38 @@ async def test_transaction_fetch_val_more_than_one_row(
 
 
 async def test_transaction_send_underlying_connection_to_pool(
-    psql_pool: ConnectionPool,
+    fresh_psql_pool: ConnectionPool,
 ) -> None:
     """Test send underlying connection to the pool."""
-    async with psql_pool.acquire() as connection:
+    async with fresh_psql_pool.acquire() as connection:
         async with connection.transaction() as transaction:
             await transaction.execute("SELECT 1")
 
-            assert not psql_pool.status().available
-        assert not psql_pool.status().available
-    assert psql_pool.status().available == 1
+            assert not fresh_psql_pool.status().available
+        assert not fresh_psql_pool.status().available
+    assert fresh_psql_pool.status().available == 1
 
 
 async def test_transaction_send_underlying_connection_to_pool_manually(
-    psql_pool: ConnectionPool,
+    fresh_psql_pool: ConnectionPool,
 ) -> None:
     """Test send underlying connection to the pool."""
-    async with psql_pool.acquire() as connection:
+    async with fresh_psql_pool.acquire() as connection:
         transaction = connection.transaction()
         await transaction.begin()
         await transaction.execute("SELECT 1")
-        assert not psql_pool.status().available
+        assert not fresh_psql_pool.status().available
         await transaction.commit()
-        assert not psql_pool.status().available
-    assert psql_pool.status().available == 1
+        assert not fresh_psql_pool.status().available
+    assert fresh_psql_pool.status().available == 1
 
 
 async def test_execute_batch_method(psql_pool: ConnectionPool) -> None:
     """Test `execute_batch` method."""
     connection = await psql_pool.connection()
-    await connection.execute(querystring="DROP TABLE IF EXISTS execute_batch")
-    await connection.execute(querystring="DROP TABLE IF EXISTS execute_batch2")
     query = (
+        "DROP TABLE IF EXISTS execute_batch;"
+        "DROP TABLE IF EXISTS execute_batch2;"
         "CREATE TABLE execute_batch (name VARCHAR);"
         "CREATE TABLE execute_batch2 (name VARCHAR);"
     )
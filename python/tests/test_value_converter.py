@@ -1,13 +1,15 @@
+import asyncio
 import datetime
 import uuid
 import zoneinfo
+from collections.abc import AsyncGenerator
 from decimal import Decimal
 from enum import Enum
 from ipaddress import IPv4Address
 from typing import Annotated, Any
 
 import pytest
-from psqlpy import ConnectionPool
+from psqlpy import Connection, ConnectionPool
 from psqlpy.exceptions import PyToRustValueMappingError
 from psqlpy.extra_types import (
     JSON,
@@ -60,6 +62,12 @@ from tests.conftest import DefaultPydanticModel, DefaultPythonModelClass
 uuid_ = uuid.uuid4()
 pytestmark = pytest.mark.anyio
 now_datetime = datetime.datetime.now()  # noqa: DTZ005
+json_value = {
+    "test": ["something", 123, "here"],
+    "nested": ["JSON"],
+}
+interval_value = datetime.timedelta(days=100, microseconds=100)
+inet_value = IPv4Address("192.0.0.1")
 now_datetime_with_tz = datetime.datetime(
     2024,
     4,
@@ -94,6 +102,175 @@ now_datetime_with_tz_in_asia_jakarta = datetime.datetime(
 )
 
 
+class MoodEnum(Enum):
+    OK = "ok"
+    SAD = "sad"
+    HAPPY = "happy"
+
+
+class MoodStrEnum(str, Enum):
+    OK = "ok"
+    SAD = "sad"
+    HAPPY = "happy"
+
+
+class ValidateModelForInnerValueType(BaseModel):
+    inner_value: str
+    some_enum: MoodEnum
+
+
+class ValidateModelForCustomType(BaseModel):
+    bytea_: bytes
+    varchar_: str
+    text_: str
+    bool_: bool
+    int2_: int
+    int4_: int
+    int8_: int
+    float8_def_: float
+    float4_: float
+    float8_: float
+    date_: datetime.date
+    time_: datetime.time
+    timestamp_: datetime.datetime
+    timestampz_: datetime.datetime
+    uuid_: uuid.UUID
+    inet_: IPv4Address
+    jsonb_: dict[str, list[str | int | list[str]]]
+    json_: dict[str, list[str | int | list[str]]]
+    point_: tuple[float, float]
+    box_: tuple[tuple[float, float], tuple[float, float]]
+    path_: list[tuple[float, float]]
+    line_: Annotated[list[float], 3]
+    lseg_: Annotated[list[tuple[float, float]], 2]
+    circle_: tuple[tuple[float, float], float]
+
+    varchar_arr: list[str]
+    varchar_arr_mdim: list[list[str]]
+    text_arr: list[str]
+    bool_arr: list[bool]
+    int2_arr: list[int]
+    int4_arr: list[int]
+    int8_arr: list[int]
+    float8_arr: list[float]
+    date_arr: list[datetime.date]
+    time_arr: list[datetime.time]
+    timestamp_arr: list[datetime.datetime]
+    timestampz_arr: list[datetime.datetime]
+    uuid_arr: list[uuid.UUID]
+    inet_arr: list[IPv4Address]
+    jsonb_arr: list[dict[str, list[str | int | list[str]]]]
+    json_arr: list[dict[str, list[str | int | list[str]]]]
+    point_arr: list[tuple[float, float]]
+    box_arr: list[tuple[tuple[float, float], tuple[float, float]]]
+    path_arr: list[list[tuple[float, float]]]
+    line_arr: list[Annotated[list[float], 3]]
+    lseg_arr: list[Annotated[list[tuple[float, float]], 2]]
+    circle_arr: list[tuple[tuple[float, float], float]]
+
+    test_inner_value: ValidateModelForInnerValueType
+    test_enum_type: MoodEnum
+
+
+class TopLevelModel(BaseModel):
+    custom_type: ValidateModelForCustomType
+
+
+@pytest.fixture(scope="module")
+async def composite_types_table(
+    psql_pool: ConnectionPool,
+) -> AsyncGenerator[str, None]:
+    """
+    Table with a column of composite type covering all supported types.
+
+    Types and the table are created once per module,
+    tests must truncate the table before use.
+    """
+    table_name = "for_test_composite"
+    create_type_query = """
+        CREATE TYPE all_types AS (
+            bytea_ BYTEA,
+            varchar_ VARCHAR,
+            text_ TEXT,
+            bool_ BOOL,
+            int2_ INT2,
+            int4_ INT4,
+            int8_ INT8,
+            float8_def_ FLOAT8,
+            float4_ FLOAT4,
+            float8_ FLOAT8,
+            date_ DATE,
+            time_ TIME,
+            timestamp_ TIMESTAMP,
+            timestampz_ TIMESTAMPTZ,
+            uuid_ UUID,
+            inet_ INET,
+            jsonb_ JSONB,
+            json_ JSON,
+            point_ POINT,
+            box_ BOX,
+            path_ PATH,
+            line_ LINE,
+            lseg_ LSEG,
+            circle_ CIRCLE,
+
+            varchar_arr VARCHAR ARRAY,
+            varchar_arr_mdim VARCHAR ARRAY,
+            text_arr TEXT ARRAY,
+            bool_arr BOOL ARRAY,
+            int2_arr INT2 ARRAY,
+            int4_arr INT4 ARRAY,
+            int8_arr INT8 ARRAY,
+            float8_arr FLOAT8 ARRAY,
+            date_arr DATE ARRAY,
+            time_arr TIME ARRAY,
+            timestamp_arr TIMESTAMP ARRAY,
+            timestampz_arr TIMESTAMPTZ ARRAY,
+            uuid_arr UUID ARRAY,
+            inet_arr INET ARRAY,
+            jsonb_arr JSONB ARRAY,
+            json_arr JSON ARRAY,
+            test_inner_value inner_type,
+            test_enum_type enum_type,
+            point_arr POINT ARRAY,
+            box_arr BOX ARRAY,
+            path_arr PATH ARRAY,
+            line_arr LINE ARRAY,
+            lseg_arr LSEG ARRAY,
+            circle_arr CIRCLE ARRAY
+        )
+    """
+    async with psql_pool.acquire() as connection:
+        await connection.execute_batch(
+            f"DROP TABLE IF EXISTS {table_name};"
+            "DROP TYPE IF EXISTS all_types;"
+            "DROP TYPE IF EXISTS inner_type;"
+            "DROP TYPE IF EXISTS enum_type;"
+            "CREATE TYPE enum_type AS ENUM ('sad', 'ok', 'happy');"
+            "CREATE TYPE inner_type AS (inner_value VARCHAR, some_enum enum_type);"
+            f"{create_type_query};"
+            f"CREATE TABLE {table_name} (custom_type all_types)",
+        )
+
+    yield table_name
+
+    async with psql_pool.acquire() as connection:
+        await connection.execute_batch(
+            f"DROP TABLE {table_name};"
+            "DROP TYPE all_types;"
+            "DROP TYPE inner_type;"
+            "DROP TYPE enum_type",
+        )
+
+
+def _case_ids(cases: list[tuple[str, Any, Any]]) -> list[str]:
+    """Build short test ids from the postgres type of each case.
+
+    Default ids would walk the nested values of every case.
+    """
+    return [f"{idx}-{postgres_type}" for idx, (postgres_type, _, _) in enumerate(cases)]
+
+
 async def test_as_class(
     psql_pool: ConnectionPool,
     table_name: str,
@@ -123,273 +300,204 @@ async def test_as_class(
         assert isinstance(single_py_record, DefaultPythonModelClass)
 
 
+SIMPLE_TYPE_CASES: list[tuple[str, Any, Any]] = [
+    ("BYTEA", b"Bytes", b"Bytes"),
+    ("VARCHAR", "Some String", "Some String"),
+    ("TEXT", "Some String", "Some String"),
+    (
+        "XML",
+        """<?xml version="1.0"?><book><title>Manual</title><chapter>...</chapter></book>""",  # noqa: E501
+        """<book><title>Manual</title><chapter>...</chapter></book>""",
+    ),
+    ("BOOL", True, True),
+    ("INT2", SmallInt(12), 12),
+    ("INT2", 12, 12),
+    ("INT4", Integer(121231231), 121231231),
+    ("INT4", 121231231, 121231231),
+    ("INT8", BigInt(99999999999999999), 99999999999999999),
+    ("INT8", 99999999999999999, 99999999999999999),
+    ("MONEY", Money(99999999999999999), 99999999999999999),
+    ("MONEY", 99999999999999999, 99999999999999999),
+    ("NUMERIC(5, 2)", Decimal("120.12"), Decimal("120.12")),
+    ("NUMERIC(5, 2)", Decimal("120.123"), Decimal("120.12")),
+    ("NUMERIC(5, 2)", Decimal(120), Decimal(120)),
+    ("NUMERIC(5, 3)", Decimal("12.123"), Decimal("12.123")),
+    ("FLOAT4", Float32(32.12329864501953), 32.12329864501953),
+    ("FLOAT4", 32.12329864501953, 32.12329864501953),
+    ("FLOAT8", Float64(32.12329864501953), 32.12329864501953),
+    ("FLOAT8", 32.12329864501953, 32.12329864501953),
+    ("DATE", now_datetime.date(), now_datetime.date()),
+    ("TIME", now_datetime.time(), now_datetime.time()),
+    ("TIMESTAMP", now_datetime, now_datetime),
+    ("TIMESTAMPTZ", now_datetime_with_tz, now_datetime_with_tz),
+    (
+        "TIMESTAMPTZ",
+        now_datetime_with_tz_in_asia_jakarta,
+        now_datetime_with_tz_in_asia_jakarta,
+    ),
+    ("UUID", uuid_, str(uuid_)),
+    ("INET", inet_value, inet_value),
+    (
+        "JSONB",
+        json_value,
+        json_value,
+    ),
+    (
+        "JSONB",
+        JSONB([{"array": "json"}, {"one more": "test"}]),
+        [{"array": "json"}, {"one more": "test"}],
+    ),
+    (
+        "JSONB",
+        JSONB([1, "1", 1.0]),
+        [1, "1", 1.0],
+    ),
+    (
+        "JSON",
+        json_value,
+        json_value,
+    ),
+    (
+        "JSON",
+        JSON([{"array": "json"}, {"one more": "test"}]),
+        [{"array": "json"}, {"one more": "test"}],
+    ),
+    (
+        "JSON",
+        JSON([1, "1", 1.0]),
+        [1, "1", 1.0],
+    ),
+    (
+        "JSONB",
+        [[1, 2], [3]],
+        [[1, 2], [3]],
+    ),
+    (
+        "JSON",
+        [[1, 2], [3]],
+        [[1, 2], [3]],
+    ),
+    (
+        "JSONB",
+        {"nested": [[1, 2], [3]]},
+        {"nested": [[1, 2], [3]]},
+    ),
+    (
+        "JSON",
+        {"nested": [[1, 2], [3]]},
+        {"nested": [[1, 2], [3]]},
+    ),
+    (
+        "MACADDR",
+        MacAddr6("08:00:2b:01:02:03"),
+        "08:00:2B:01:02:03",
+    ),
+    (
+        "MACADDR8",
+        MacAddr8("08:00:2b:01:02:03:04:05"),
+        "08:00:2B:01:02:03:04:05",
+    ),
+    ("POINT", Point([1.5, 2]), (1.5, 2.0)),
+    ("POINT", Point({1.2, 2.3}), (1.2, 2.3)),
+    ("POINT", Point((1.7, 2.8)), (1.7, 2.8)),
+    ("BOX", Box([3.5, 3, 9, 9]), ((9.0, 9.0), (3.5, 3.0))),
+    ("BOX", Box({(1, 2), (9, 9)}), ((9.0, 9.0), (1.0, 2.0))),
+    ("BOX", Box(((1.7, 2.8), (9, 9))), ((9.0, 9.0), (1.7, 2.8))),
+    (
+        "PATH",
+        Path([(3.5, 3), (9, 9), (8, 8)]),
+        [(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)],
+    ),
+    (
+        "PATH",
+        Path(((1.7, 2.8), (3.3, 2.5), (9, 9), (1.7, 2.8))),
+        ((1.7, 2.8), (3.3, 2.5), (9.0, 9.0), (1.7, 2.8)),
+    ),
+    ("LINE", Line([-2, 1, 2]), (-2.0, 1.0, 2.0)),
+    ("LINE", Line([1, -2, 3]), (1.0, -2.0, 3.0)),
+    ("LSEG", LineSegment({(1, 2), (9, 9)}), [(1.0, 2.0), (9.0, 9.0)]),
+    ("LSEG", LineSegment(((1.7, 2.8), (9, 9))), [(1.7, 2.8), (9.0, 9.0)]),
+    (
+        "CIRCLE",
+        Circle((1.7, 2.8, 3)),
+        ((1.7, 2.8), 3.0),
+    ),
+    (
+        "CIRCLE",
+        Circle([1, 2.8, 3]),
+        ((1.0, 2.8), 3.0),
+    ),
+    (
+        "INTERVAL",
+        interval_value,
+        interval_value,
+    ),
+]
+
+
 @pytest.mark.parametrize(
     ("postgres_type", "py_value", "expected_deserialized"),
-    [
-        ("BYTEA", b"Bytes", b"Bytes"),
-        ("VARCHAR", "Some String", "Some String"),
-        ("TEXT", "Some String", "Some String"),
-        (
-            "XML",
-            """<?xml version="1.0"?><book><title>Manual</title><chapter>...</chapter></book>""",  # noqa: E501
-            """<book><title>Manual</title><chapter>...</chapter></book>""",
-        ),
-        ("BOOL", True, True),
-        ("INT2", SmallInt(12), 12),
-        ("INT2", 12, 12),
-        ("INT4", Integer(121231231), 121231231),
-        ("INT4", 121231231, 121231231),
-        ("INT8", BigInt(99999999999999999), 99999999999999999),
-        ("INT8", 99999999999999999, 99999999999999999),
-        ("MONEY", Money(99999999999999999), 99999999999999999),
-        ("MONEY", 99999999999999999, 99999999999999999),
-        ("NUMERIC(5, 2)", Decimal("120.12"), Decimal("120.12")),
-        ("NUMERIC(5, 2)", Decimal("120.123"), Decimal("120.12")),
-        ("NUMERIC(5, 2)", Decimal(120), Decimal(120)),
-        ("NUMERIC(5, 3)", Decimal("12.123"), Decimal("12.123")),
-        ("FLOAT4", Float32(32.12329864501953), 32.12329864501953),
-        ("FLOAT4", 32.12329864501953, 32.12329864501953),
-        ("FLOAT8", Float64(32.12329864501953), 32.12329864501953),
-        ("FLOAT8", 32.12329864501953, 32.12329864501953),
-        ("DATE", now_datetime.date(), now_datetime.date()),
-        ("TIME", now_datetime.time(), now_datetime.time()),
-        ("TIMESTAMP", now_datetime, now_datetime),
-        ("TIMESTAMPTZ", now_datetime_with_tz, now_datetime_with_tz),
-        (
-            "TIMESTAMPTZ",
-            now_datetime_with_tz_in_asia_jakarta,
-            now_datetime_with_tz_in_asia_jakarta,
-        ),
-        ("UUID", uuid_, str(uuid_)),
-        ("INET", IPv4Address("192.0.0.1"), IPv4Address("192.0.0.1")),
-        (
-            "JSONB",
-            {
-                "test": ["something", 123, "here"],
-                "nested": ["JSON"],
-            },
-            {
-                "test": ["something", 123, "here"],
-                "nested": ["JSON"],
-            },
-        ),
-        (
-            "JSONB",
-            JSONB([{"array": "json"}, {"one more": "test"}]),
-            [{"array": "json"}, {"one more": "test"}],
-        ),
-        (
-            "JSONB",
-            JSONB([1, "1", 1.0]),
-            [1, "1", 1.0],
-        ),
-        (
-            "JSON",
-            {
-                "test": ["something", 123, "here"],
-                "nested": ["JSON"],
-            },
-            {
-                "test": ["something", 123, "here"],
-                "nested": ["JSON"],
-            },
-        ),
-        (
-            "JSON",
-            JSON([{"array": "json"}, {"one more": "test"}]),
-            [{"array": "json"}, {"one more": "test"}],
-        ),
-        (
-            "JSON",
-            JSON([1, "1", 1.0]),
-            [1, "1", 1.0],
-        ),
-        (
-            "JSONB",
-            [[1, 2], [3]],
-            [[1, 2], [3]],
-        ),
-        (
-            "JSON",
-            [[1, 2], [3]],
-            [[1, 2], [3]],
-        ),
-        (
-            "JSONB",
-            {"nested": [[1, 2], [3]]},
-            {"nested": [[1, 2], [3]]},
-        ),
-        (
-            "JSON",
-            {"nested": [[1, 2], [3]]},
-            {"nested": [[1, 2], [3]]},
-        ),
-        (
-            "MACADDR",
-            MacAddr6("08:00:2b:01:02:03"),
-            "08:00:2B:01:02:03",
-        ),
-        (
-            "MACADDR8",
-            MacAddr8("08:00:2b:01:02:03:04:05"),
-            "08:00:2B:01:02:03:04:05",
-        ),
-        ("POINT", Point([1.5, 2]), (1.5, 2.0)),
-        ("POINT", Point({1.2, 2.3}), (1.2, 2.3)),
-        ("POINT", Point((1.7, 2.8)), (1.7, 2.8)),
-        ("BOX", Box([3.5, 3, 9, 9]), ((9.0, 9.0), (3.5, 3.0))),
-        ("BOX", Box({(1, 2), (9, 9)}), ((9.0, 9.0), (1.0, 2.0))),
-        ("BOX", Box(((1.7, 2.8), (9, 9))), ((9.0, 9.0), (1.7, 2.8))),
-        (
-            "PATH",
-            Path([(3.5, 3), (9, 9), (8, 8)]),
-            [(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)],
-        ),
-        (
-            "PATH",
-            Path(((1.7, 2.8), (3.3, 2.5), (9, 9), (1.7, 2.8))),
-            ((1.7, 2.8), (3.3, 2.5), (9.0, 9.0), (1.7, 2.8)),
-        ),
-        ("LINE", Line([-2, 1, 2]), (-2.0, 1.0, 2.0)),
-        ("LINE", Line([1, -2, 3]), (1.0, -2.0, 3.0)),
-        ("LSEG", LineSegment({(1, 2), (9, 9)}), [(1.0, 2.0), (9.0, 9.0)]),
-        ("LSEG", LineSegment(((1.7, 2.8), (9, 9))), [(1.7, 2.8), (9.0, 9.0)]),
-        (
-            "CIRCLE",
-            Circle((1.7, 2.8, 3)),
-            ((1.7, 2.8), 3.0),
-        ),
-        (
-            "CIRCLE",
-            Circle([1, 2.8, 3]),
-            ((1.0, 2.8), 3.0),
-        ),
-        (
-            "INTERVAL",
-            datetime.timedelta(days=100, microseconds=100),
-            datetime.timedelta(days=100, microseconds=100),
-        ),
-    ],
+    SIMPLE_TYPE_CASES,
+    ids=_case_ids(SIMPLE_TYPE_CASES),
 )
 async def test_deserialization_simple_into_python(
-    psql_pool: ConnectionPool,
+    module_conn: Connection,
     postgres_type: str,
     py_value: Any,
     expected_deserialized: Any,
 ) -> None:
-    """Test how types can cast from Python and to Python."""
-    connection = await psql_pool.connection()
-    table_name = f"for_test{uuid.uuid4().hex}"
-    await connection.execute(f"DROP TABLE IF EXISTS {table_name}")
-    create_table_query = f"""
-    CREATE TABLE {table_name} (test_field {postgres_type})
-    """
-    insert_data_query = f"""
-    INSERT INTO {table_name} VALUES ($1)
+    """Test how types can cast from Python and to Python.
+
+    Value is sent as a parameter of `postgres_type` and selected back,
+    so there is no need to create a table for every case.
     """
-    await connection.execute(querystring=create_table_query)
-    await connection.execute(
-        querystring=insert_data_query,
+    raw_result = await module_conn.execute(
+        querystring=f"SELECT $1::{postgres_type} AS test_field",
         parameters=[py_value],
     )
 
-    raw_result = await connection.execute(
-        querystring=f"SELECT test_field FROM {table_name}",
-    )
+    assert raw_result.value() == expected_deserialized
+
 
-    assert raw_result.result()[0]["test_field"] == expected_deserialized
+async def test_deserialization_simple_into_python_concurrently(
+    module_conn: Connection,
+) -> None:
+    """Test that all simple type cases can be in flight on one connection.
 
-    await connection.execute(f"DROP TABLE IF EXISTS {table_name}")
+    Queries are pipelined, so results must not be mixed up between cases.
+    """
+    raw_results = await asyncio.gather(
+        *(
+            module_conn.execute(
+                querystring=f"SELECT $1::{postgres_type} AS test_field",
+                parameters=[py_value],
+            )
+            for postgres_type, py_value, _ in SIMPLE_TYPE_CASES
+        ),
+    )
+
+    for raw_result, (_, _, expected_deserialized) in zip(
+        raw_results,
+        SIMPLE_TYPE_CASES,
+        strict=True,
+    ):
+        assert raw_result.value() == expected_deserialized
 
 
 async def test_deserialization_composite_into_python(
     psql_pool: ConnectionPool,
+    composite_types_table: str,
 ) -> None:
     """Test that it's possible to deserialize custom postgresql type."""
     connection = await psql_pool.connection()
-    await connection.execute("DROP TABLE IF EXISTS for_test")
-    await connection.execute("DROP TYPE IF EXISTS all_types")
-    await connection.execute("DROP TYPE IF EXISTS inner_type")
-    await connection.execute("DROP TYPE IF EXISTS enum_type")
-    await connection.execute("CREATE TYPE enum_type AS ENUM ('sad', 'ok', 'happy')")
-    await connection.execute(
-        "CREATE TYPE inner_type AS (inner_value VARCHAR, some_enum enum_type)",
-    )
-    create_type_query = """
-    CREATE type all_types AS (
-        bytea_ BYTEA,
-        varchar_ VARCHAR,
-        text_ TEXT,
-        bool_ BOOL,
-        int2_ INT2,
-        int4_ INT4,
-        int8_ INT8,
-        float8_def_ FLOAT8,
-        float4_ FLOAT4,
-        float8_ FLOAT8,
-        date_ DATE,
-        time_ TIME,
-        timestamp_ TIMESTAMP,
-        timestampz_ TIMESTAMPTZ,
-        uuid_ UUID,
-        inet_ INET,
-        jsonb_ JSONB,
-        json_ JSON,
-        point_ POINT,
-        box_ BOX,
-        path_ PATH,
-        line_ LINE,
-        lseg_ LSEG,
-        circle_ CIRCLE,
-
-        varchar_arr VARCHAR ARRAY,
-        varchar_arr_mdim VARCHAR ARRAY,
-        text_arr TEXT ARRAY,
-        bool_arr BOOL ARRAY,
-        int2_arr INT2 ARRAY,
-        int4_arr INT4 ARRAY,
-        int8_arr INT8 ARRAY,
-        float8_arr FLOAT8 ARRAY,
-        date_arr DATE ARRAY,
-        time_arr TIME ARRAY,
-        timestamp_arr TIMESTAMP ARRAY,
-        timestampz_arr TIMESTAMPTZ ARRAY,
-        uuid_arr UUID ARRAY,
-        inet_arr INET ARRAY,
-        jsonb_arr JSONB ARRAY,
-        json_arr JSON ARRAY,
-        test_inner_value inner_type,
-        test_enum_type enum_type,
-        point_arr POINT ARRAY,
-        box_arr BOX ARRAY,
-        path_arr PATH ARRAY,
-        line_arr LINE ARRAY,
-        lseg_arr LSEG ARRAY,
-        circle_arr CIRCLE ARRAY
-    )
-    """
-    create_table_query = """
-    CREATE table for_test (custom_type all_types)
-    """
-
-    await connection.execute(
-        querystring=create_type_query,
-    )
-    await connection.execute(
-        querystring=create_table_query,
-    )
-
-    class TestEnum(Enum):
-        OK = "ok"
-        SAD = "sad"
-        HAPPY = "happy"
+    await connection.execute(f"TRUNCATE {composite_types_table}")
 
     row_values = ", ".join([f"${index}" for index in range(1, 41)])
     row_values += ", ROW($41, $42), "
     row_values += ", ".join([f"${index}" for index in range(43, 50)])
 
     await connection.execute(
-        querystring=f"INSERT INTO for_test VALUES (ROW({row_values}))",
+        querystring=f"INSERT INTO {composite_types_table} VALUES (ROW({row_values}))",
         parameters=[
             b"Bytes",
             "Some String",
@@ -406,17 +514,9 @@ async def test_deserialization_composite_into_python(
             now_datetime,
             now_datetime_with_tz,
             uuid_,
-            IPv4Address("192.0.0.1"),
-            {
-                "test": ["something", 123, "here"],
-                "nested": ["JSON"],
-            },
-            JSON(
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-            ),
+            inet_value,
+            json_value,
+            JSON(json_value),
             Point({1.2, 2.3}),
             Box(((1.7, 2.8), (9, 9))),
             Path(((1.7, 2.8), (3.3, 2.5), (9, 9), (1.7, 2.8))),
@@ -436,34 +536,18 @@ async def test_deserialization_composite_into_python(
             [now_datetime, now_datetime],
             [now_datetime_with_tz, now_datetime_with_tz],
             [uuid_, uuid_],
-            [IPv4Address("192.0.0.1"), IPv4Address("192.0.0.1")],
+            [inet_value, inet_value],
             [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
+                json_value,
+                json_value,
             ],
             [
-                JSON(
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
-                ),
-                JSON(
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
-                ),
+                JSON(json_value),
+                JSON(json_value),
             ],
             "inner type value",
             "happy",
-            TestEnum.OK,
+            MoodEnum.OK,
             [
                 Point([1.5, 2]),
                 Point([2, 3]),
@@ -491,67 +575,8 @@ async def test_deserialization_composite_into_python(
         ],
     )
 
-    class ValidateModelForInnerValueType(BaseModel):
-        inner_value: str
-        some_enum: TestEnum
-
-    class ValidateModelForCustomType(BaseModel):
-        bytea_: bytes
-        varchar_: str
-        text_: str
-        bool_: bool
-        int2_: int
-        int4_: int
-        int8_: int
-        float8_def_: float
-        float4_: float
-        float8_: float
-        date_: datetime.date
-        time_: datetime.time
-        timestamp_: datetime.datetime
-        timestampz_: datetime.datetime
-        uuid_: uuid.UUID
-        inet_: IPv4Address
-        jsonb_: dict[str, list[str | int | list[str]]]
-        json_: dict[str, list[str | int | list[str]]]
-        point_: tuple[float, float]
-        box_: tuple[tuple[float, float], tuple[float, float]]
-        path_: list[tuple[float, float]]
-        line_: Annotated[list[float], 3]
-        lseg_: Annotated[list[tuple[float, float]], 2]
-        circle_: tuple[tuple[float, float], float]
-
-        varchar_arr: list[str]
-        varchar_arr_mdim: list[list[str]]
-        text_arr: list[str]
-        bool_arr: list[bool]
-        int2_arr: list[int]
-        int4_arr: list[int]
-        int8_arr: list[int]
-        float8_arr: list[float]
-        date_arr: list[datetime.date]
-        time_arr: list[datetime.time]
-        timestamp_arr: list[datetime.datetime]
-        timestampz_arr: list[datetime.datetime]
-        uuid_arr: list[uuid.UUID]
-        inet_arr: list[IPv4Address]
-        jsonb_arr: list[dict[str, list[str | int | list[str]]]]
-        json_arr: list[dict[str, list[str | int | list[str]]]]
-        point_arr: list[tuple[float, float]]
-        box_arr: list[tuple[tuple[float, float], tuple[float, float]]]
-        path_arr: list[list[tuple[float, float]]]
-        line_arr: list[Annotated[list[float], 3]]
-        lseg_arr: list[Annotated[list[tuple[float, float]], 2]]
-        circle_arr: list[tuple[tuple[float, float], float]]
-
-        test_inner_value: ValidateModelForInnerValueType
-        test_enum_type: TestEnum
-
-    class TopLevelModel(BaseModel):
-        custom_type: ValidateModelForCustomType
-
     query_result = await connection.execute(
-        "SELECT custom_type FROM for_test",
+        f"SELECT custom_type FROM {composite_types_table}",
     )
 
     model_result = query_result.as_class(
@@ -563,38 +588,25 @@ async def test_deserialization_composite_into_python(
 
 async def test_enum_type(psql_pool: ConnectionPool) -> None:
     """Test that we can decode ENUM type from PostgreSQL."""
-
-    class TestEnum(Enum):
-        OK = "ok"
-        SAD = "sad"
-        HAPPY = "happy"
-
-    class TestStrEnum(str, Enum):
-        OK = "ok"
-        SAD = "sad"
-        HAPPY = "happy"
-
     connection = await psql_pool.connection()
-    await connection.execute("DROP TABLE IF EXISTS for_test")
-    await connection.execute("DROP TYPE IF EXISTS mood")
-    await connection.execute(
-        "CREATE TYPE mood AS ENUM ('sad', 'ok', 'happy')",
-    )
-    await connection.execute(
+    await connection.execute_batch(
+        "DROP TABLE IF EXISTS for_test;"
+        "DROP TYPE IF EXISTS mood;"
+        "CREATE TYPE mood AS ENUM ('sad', 'ok', 'happy');"
         "CREATE TABLE for_test (test_mood mood, test_mood2 mood)",
     )
 
     await connection.execute(
         querystring="INSERT INTO for_test VALUES ($1, $2)",
-        parameters=[TestEnum.HAPPY, TestEnum.OK],
+        parameters=[MoodEnum.HAPPY, MoodEnum.OK],
     )
 
     qs_result = await connection.execute(
         "SELECT * FROM for_test",
     )
-    assert qs_result.result()[0]["test_mood"] == TestEnum.HAPPY.value
-    assert qs_result.result()[0]["test_mood"] != TestEnum.HAPPY
-    assert qs_result.result()[0]["test_mood2"] == TestStrEnum.OK
+    assert qs_result.result()[0]["test_mood"] == MoodEnum.HAPPY.value
+    assert qs_result.result()[0]["test_mood"] != MoodEnum.HAPPY
+    assert qs_result.result()[0]["test_mood2"] == MoodStrEnum.OK
 
 
 async def test_char_internal_type_pg_type_reproduction(
@@ -682,8 +694,8 @@ async def test_custom_type_as_parameter(
 ) -> None:
     """Tests that we can use `PyCustomType`."""
     connection = await psql_pool.connection()
-    await connection.execute("DROP TABLE IF EXISTS for_test")
-    await connection.execute(
+    await connection.execute_batch(
+        "DROP TABLE IF EXISTS for_test;"
         "CREATE TABLE for_test (nickname VARCHAR)",
     )
 
@@ -843,743 +855,646 @@ async def test_empty_array(
         assert not json_result[0]["e_array"]
 
 
-@pytest.mark.parametrize(
-    ("postgres_type", "py_value", "expected_deserialized"),
-    [
-        ("VARCHAR ARRAY", [], []),
-        (
-            "VARCHAR ARRAY",
-            VarCharArray(["Some String", "Some String"]),
-            ["Some String", "Some String"],
-        ),
-        ("VARCHAR ARRAY", VarCharArray([]), []),
-        ("TEXT ARRAY", [], []),
-        ("TEXT ARRAY", TextArray([]), []),
-        (
-            "TEXT ARRAY",
-            TextArray([Text("Some String"), Text("Some String")]),
-            ["Some String", "Some String"],
-        ),
-        ("BOOL ARRAY", [], []),
-        ("BOOL ARRAY", BoolArray([]), []),
-        ("BOOL ARRAY", BoolArray([True, False]), [True, False]),
-        ("BOOL ARRAY", BoolArray([[True], [False]]), [[True], [False]]),
-        ("INT2 ARRAY", [], []),
-        ("INT2 ARRAY", Int16Array([]), []),
-        ("INT2 ARRAY", Int16Array([SmallInt(12), SmallInt(100)]), [12, 100]),
-        ("INT2 ARRAY", Int16Array([[SmallInt(12)], [SmallInt(100)]]), [[12], [100]]),
-        ("INT4 ARRAY", [], []),
-        (
-            "INT4 ARRAY",
-            Int32Array([Integer(121231231), Integer(121231231)]),
-            [121231231, 121231231],
-        ),
-        (
-            "INT4 ARRAY",
-            Int32Array([[Integer(121231231)], [Integer(121231231)]]),
-            [[121231231], [121231231]],
-        ),
-        ("INT8 ARRAY", [], []),
-        (
-            "INT8 ARRAY",
-            Int64Array([BigInt(99999999999999999), BigInt(99999999999999999)]),
-            [99999999999999999, 99999999999999999],
-        ),
-        (
-            "INT8 ARRAY",
-            Int64Array([[BigInt(99999999999999999)], [BigInt(99999999999999999)]]),
-            [[99999999999999999], [99999999999999999]],
-        ),
-        ("MONEY ARRAY", [], []),
-        (
-            "MONEY ARRAY",
-            MoneyArray([Money(99999999999999999), Money(99999999999999999)]),
-            [99999999999999999, 99999999999999999],
-        ),
-        ("NUMERIC(5, 2) ARRAY", [], []),
-        (
-            "NUMERIC(5, 2) ARRAY",
-            NumericArray([Decimal("121.23"), Decimal("188.99")]),
-            [Decimal("121.23"), Decimal("188.99")],
-        ),
-        (
-            "NUMERIC(5, 2) ARRAY",
-            NumericArray([Decimal("121.123"), Decimal("188.99")]),
-            [
-                Decimal("121.12").quantize(Decimal("100.00")),
-                Decimal("188.99").quantize(Decimal("100.00")),
-            ],
-        ),
-        (
-            "NUMERIC(5, 2) ARRAY",
-            NumericArray([Decimal(121), Decimal(188)]),
-            [Decimal(121), Decimal(188)],
-        ),
-        (
-            "NUMERIC(5, 2) ARRAY",
-            NumericArray([[Decimal("121.23")], [Decimal("188.99")]]),
-            [[Decimal("121.23")], [Decimal("188.99")]],
-        ),
-        (
-            "NUMERIC(5, 2) ARRAY",
-            NumericArray([[Decimal("121.123")], [Decimal("188.99")]]),
-            [
-                [Decimal("121.12").quantize(Decimal("100.00"))],
-                [Decimal("188.99").quantize(Decimal("100.00"))],
-            ],
-        ),
-        (
-            "NUMERIC(5, 2) ARRAY",
-            NumericArray([[Decimal(121)], [Decimal(188)]]),
-            [[Decimal(121)], [Decimal(188)]],
-        ),
-        ("FLOAT4 ARRAY", [], []),
-        (
-            "FLOAT4 ARRAY",
-            [32.12329864501953, 32.12329864501953],
-            [32.12329864501953, 32.12329864501953],
-        ),
-        ("FLOAT8 ARRAY", [], []),
-        (
-            "FLOAT8 ARRAY",
-            Float64Array([32.12329864501953, 32.12329864501953]),
-            [32.12329864501953, 32.12329864501953],
-        ),
-        (
-            "FLOAT8 ARRAY",
-            Float64Array([[32.12329864501953], [32.12329864501953]]),
-            [[32.12329864501953], [32.12329864501953]],
-        ),
-        ("DATE ARRAY", [], []),
-        (
-            "DATE ARRAY",
-            DateArray([now_datetime.date(), now_datetime.date()]),
-            [now_datetime.date(), now_datetime.date()],
-        ),
-        (
-            "DATE ARRAY",
-            DateArray([[now_datetime.date()], [now_datetime.date()]]),
-            [[now_datetime.date()], [now_datetime.date()]],
-        ),
-        ("TIME ARRAY", [], []),
-        (
-            "TIME ARRAY",
-            TimeArray([now_datetime.time(), now_datetime.time()]),
-            [now_datetime.time(), now_datetime.time()],
-        ),
-        (
-            "TIME ARRAY",
-            TimeArray([[now_datetime.time()], [now_datetime.time()]]),
-            [[now_datetime.time()], [now_datetime.time()]],
-        ),
-        ("TIMESTAMP ARRAY", [], []),
-        (
-            "TIMESTAMP ARRAY",
-            DateTimeArray([now_datetime, now_datetime]),
-            [now_datetime, now_datetime],
-        ),
-        (
-            "TIMESTAMP ARRAY",
-            DateTimeArray([[now_datetime], [now_datetime]]),
-            [[now_datetime], [now_datetime]],
-        ),
-        ("TIMESTAMPTZ ARRAY", [], []),
-        (
-            "TIMESTAMPTZ ARRAY",
-            DateTimeTZArray([now_datetime_with_tz, now_datetime_with_tz]),
-            [now_datetime_with_tz, now_datetime_with_tz],
-        ),
-        (
-            "TIMESTAMPTZ ARRAY",
-            DateTimeTZArray([[now_datetime_with_tz], [now_datetime_with_tz]]),
-            [[now_datetime_with_tz], [now_datetime_with_tz]],
-        ),
-        ("UUID ARRAY", [], []),
-        (
-            "UUID ARRAY",
-            UUIDArray([[uuid_], [uuid_]]),
-            [[str(uuid_)], [str(uuid_)]],
-        ),
-        ("INET ARRAY", [], []),
-        (
-            "INET ARRAY",
-            IpAddressArray([IPv4Address("192.0.0.1"), IPv4Address("192.0.0.1")]),
-            [IPv4Address("192.0.0.1"), IPv4Address("192.0.0.1")],
-        ),
-        (
-            "INET ARRAY",
-            IpAddressArray([[IPv4Address("192.0.0.1")], [IPv4Address("192.0.0.1")]]),
-            [[IPv4Address("192.0.0.1")], [IPv4Address("192.0.0.1")]],
-        ),
-        ("JSONB ARRAY", [], []),
-        (
-            "JSONB ARRAY",
-            [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-            ],
-            [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-            ],
-        ),
-        (
-            "JSONB ARRAY",
-            JSONBArray(
-                [
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
-                ],
-            ),
+ARRAY_TYPE_CASES: list[tuple[str, Any, Any]] = [
+    ("VARCHAR ARRAY", [], []),
+    (
+        "VARCHAR ARRAY",
+        VarCharArray(["Some String", "Some String"]),
+        ["Some String", "Some String"],
+    ),
+    ("VARCHAR ARRAY", VarCharArray([]), []),
+    ("TEXT ARRAY", [], []),
+    ("TEXT ARRAY", TextArray([]), []),
+    (
+        "TEXT ARRAY",
+        TextArray([Text("Some String"), Text("Some String")]),
+        ["Some String", "Some String"],
+    ),
+    ("BOOL ARRAY", [], []),
+    ("BOOL ARRAY", BoolArray([]), []),
+    ("BOOL ARRAY", BoolArray([True, False]), [True, False]),
+    ("BOOL ARRAY", BoolArray([[True], [False]]), [[True], [False]]),
+    ("INT2 ARRAY", [], []),
+    ("INT2 ARRAY", Int16Array([]), []),
+    ("INT2 ARRAY", Int16Array([SmallInt(12), SmallInt(100)]), [12, 100]),
+    ("INT2 ARRAY", Int16Array([[SmallInt(12)], [SmallInt(100)]]), [[12], [100]]),
+    ("INT4 ARRAY", [], []),
+    (
+        "INT4 ARRAY",
+        Int32Array([Integer(121231231), Integer(121231231)]),
+        [121231231, 121231231],
+    ),
+    (
+        "INT4 ARRAY",
+        Int32Array([[Integer(121231231)], [Integer(121231231)]]),
+        [[121231231], [121231231]],
+    ),
+    ("INT8 ARRAY", [], []),
+    (
+        "INT8 ARRAY",
+        Int64Array([BigInt(99999999999999999), BigInt(99999999999999999)]),
+        [99999999999999999, 99999999999999999],
+    ),
+    (
+        "INT8 ARRAY",
+        Int64Array([[BigInt(99999999999999999)], [BigInt(99999999999999999)]]),
+        [[99999999999999999], [99999999999999999]],
+    ),
+    ("MONEY ARRAY", [], []),
+    (
+        "MONEY ARRAY",
+        MoneyArray([Money(99999999999999999), Money(99999999999999999)]),
+        [99999999999999999, 99999999999999999],
+    ),
+    ("NUMERIC(5, 2) ARRAY", [], []),
+    (
+        "NUMERIC(5, 2) ARRAY",
+        NumericArray([Decimal("121.23"), Decimal("188.99")]),
+        [Decimal("121.23"), Decimal("188.99")],
+    ),
+    (
+        "NUMERIC(5, 2) ARRAY",
+        NumericArray([Decimal("121.123"), Decimal("188.99")]),
+        [
+            Decimal("121.12").quantize(Decimal("100.00")),
+            Decimal("188.99").quantize(Decimal("100.00")),
+        ],
+    ),
+    (
+        "NUMERIC(5, 2) ARRAY",
+        NumericArray([Decimal(121), Decimal(188)]),
+        [Decimal(121), Decimal(188)],
+    ),
+    (
+        "NUMERIC(5, 2) ARRAY",
+        NumericArray([[Decimal("121.23")], [Decimal("188.99")]]),
+        [[Decimal("121.23")], [Decimal("188.99")]],
+    ),
+    (
+        "NUMERIC(5, 2) ARRAY",
+        NumericArray([[Decimal("121.123")], [Decimal("188.99")]]),
+        [
+            [Decimal("121.12").quantize(Decimal("100.00"))],
+            [Decimal("188.99").quantize(Decimal("100.00"))],
+        ],
+    ),
+    (
+        "NUMERIC(5, 2) ARRAY",
+        NumericArray([[Decimal(121)], [Decimal(188)]]),
+        [[Decimal(121)], [Decimal(188)]],
+    ),
+    ("FLOAT4 ARRAY", [], []),
+    (
+        "FLOAT4 ARRAY",
+        [32.12329864501953, 32.12329864501953],
+        [32.12329864501953, 32.12329864501953],
+    ),
+    ("FLOAT8 ARRAY", [], []),
+    (
+        "FLOAT8 ARRAY",
+        Float64Array([32.12329864501953, 32.12329864501953]),
+        [32.12329864501953, 32.12329864501953],
+    ),
+    (
+        "FLOAT8 ARRAY",
+        Float64Array([[32.12329864501953], [32.12329864501953]]),
+        [[32.12329864501953], [32.12329864501953]],
+    ),
+    ("DATE ARRAY", [], []),
+    (
+        "DATE ARRAY",
+        DateArray([now_datetime.date(), now_datetime.date()]),
+        [now_datetime.date(), now_datetime.date()],
+    ),
+    (
+        "DATE ARRAY",
+        DateArray([[now_datetime.date()], [now_datetime.date()]]),
+        [[now_datetime.date()], [now_datetime.date()]],
+    ),
+    ("TIME ARRAY", [], []),
+    (
+        "TIME ARRAY",
+        TimeArray([now_datetime.time(), now_datetime.time()]),
+        [now_datetime.time(), now_datetime.time()],
+    ),
+    (
+        "TIME ARRAY",
+        TimeArray([[now_datetime.time()], [now_datetime.time()]]),
+        [[now_datetime.time()], [now_datetime.time()]],
+    ),
+    ("TIMESTAMP ARRAY", [], []),
+    (
+        "TIMESTAMP ARRAY",
+        DateTimeArray([now_datetime, now_datetime]),
+        [now_datetime, now_datetime],
+    ),
+    (
+        "TIMESTAMP ARRAY",
+        DateTimeArray([[now_datetime], [now_datetime]]),
+        [[now_datetime], [now_datetime]],
+    ),
+    ("TIMESTAMPTZ ARRAY", [], []),
+    (
+        "TIMESTAMPTZ ARRAY",
+        DateTimeTZArray([now_datetime_with_tz, now_datetime_with_tz]),
+        [now_datetime_with_tz, now_datetime_with_tz],
+    ),
+    (
+        "TIMESTAMPTZ ARRAY",
+        DateTimeTZArray([[now_datetime_with_tz], [now_datetime_with_tz]]),
+        [[now_datetime_with_tz], [now_datetime_with_tz]],
+    ),
+    ("UUID ARRAY", [], []),
+    (
+        "UUID ARRAY",
+        UUIDArray([[uuid_], [uuid_]]),
+        [[str(uuid_)], [str(uuid_)]],
+    ),
+    ("INET ARRAY", [], []),
+    (
+        "INET ARRAY",
+        IpAddressArray([inet_value, inet_value]),
+        [inet_value, inet_value],
+    ),
+    (
+        "INET ARRAY",
+        IpAddressArray([[inet_value], [inet_value]]),
+        [[inet_value], [inet_value]],
+    ),
+    ("JSONB ARRAY", [], []),
+    (
+        "JSONB ARRAY",
+        [
+            json_value,
+            json_value,
+        ],
+        [
+            json_value,
+            json_value,
+        ],
+    ),
+    (
+        "JSONB ARRAY",
+        JSONBArray(
             [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
+                json_value,
+                json_value,
             ],
         ),
-        (
-            "JSONB ARRAY",
-            JSONBArray(
-                [
-                    [
-                        {
-                            "test": ["something", 123, "here"],
-                            "nested": ["JSON"],
-                        },
-                    ],
-                    [
-                        {
-                            "test": ["something", 123, "here"],
-                            "nested": ["JSON"],
-                        },
-                    ],
-                ],
-            ),
+        [
+            json_value,
+            json_value,
+        ],
+    ),
+    (
+        "JSONB ARRAY",
+        JSONBArray(
             [
                 [
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
+                    json_value,
                 ],
                 [
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
+                    json_value,
                 ],
             ],
         ),
-        (
-            "JSONB ARRAY",
-            JSONBArray(
-                [
-                    JSONB([{"array": "json"}, {"one more": "test"}]),
-                    JSONB([{"array": "json"}, {"one more": "test"}]),
-                ],
-            ),
+        [
             [
-                [{"array": "json"}, {"one more": "test"}],
-                [{"array": "json"}, {"one more": "test"}],
+                json_value,
             ],
-        ),
-        (
-            "JSONB ARRAY",
-            JSONBArray(
-                [
-                    JSONB([[{"array": "json"}], [{"one more": "test"}]]),
-                    JSONB([[{"array": "json"}], [{"one more": "test"}]]),
-                ],
-            ),
             [
-                [[{"array": "json"}], [{"one more": "test"}]],
-                [[{"array": "json"}], [{"one more": "test"}]],
+                json_value,
             ],
-        ),
-        ("JSON ARRAY", [], []),
-        (
-            "JSON ARRAY",
+        ],
+    ),
+    (
+        "JSONB ARRAY",
+        JSONBArray(
             [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
+                JSONB([{"array": "json"}, {"one more": "test"}]),
+                JSONB([{"array": "json"}, {"one more": "test"}]),
             ],
+        ),
+        [
+            [{"array": "json"}, {"one more": "test"}],
+            [{"array": "json"}, {"one more": "test"}],
+        ],
+    ),
+    (
+        "JSONB ARRAY",
+        JSONBArray(
             [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
+                JSONB([[{"array": "json"}], [{"one more": "test"}]]),
+                JSONB([[{"array": "json"}], [{"one more": "test"}]]),
             ],
         ),
-        (
-            "JSON ARRAY",
-            JSONArray(
-                [
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
-                ],
-            ),
+        [
+            [[{"array": "json"}], [{"one more": "test"}]],
+            [[{"array": "json"}], [{"one more": "test"}]],
+        ],
+    ),
+    ("JSON ARRAY", [], []),
+    (
+        "JSON ARRAY",
+        [
+            json_value,
+            json_value,
+        ],
+        [
+            json_value,
+            json_value,
+        ],
+    ),
+    (
+        "JSON ARRAY",
+        JSONArray(
             [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
+                json_value,
+                json_value,
             ],
         ),
-        (
-            "JSON ARRAY",
-            JSONArray(
-                [
-                    JSON(
-                        {
-                            "test": ["something", 123, "here"],
-                            "nested": ["JSON"],
-                        },
-                    ),
-                    JSON(
-                        {
-                            "test": ["something", 123, "here"],
-                            "nested": ["JSON"],
-                        },
-                    ),
-                ],
-            ),
+        [
+            json_value,
+            json_value,
+        ],
+    ),
+    (
+        "JSON ARRAY",
+        JSONArray(
             [
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
-                {
-                    "test": ["something", 123, "here"],
-                    "nested": ["JSON"],
-                },
+                JSON(json_value),
+                JSON(json_value),
             ],
         ),
-        (
-            "JSON ARRAY",
-            JSONArray(
-                [
-                    [
-                        JSON(
-                            {
-                                "test": ["something", 123, "here"],
-                                "nested": ["JSON"],
-                            },
-                        ),
-                    ],
-                    [
-                        JSON(
-                            {
-                                "test": ["something", 123, "here"],
-                                "nested": ["JSON"],
-                            },
-                        ),
-                    ],
-                ],
-            ),
+        [
+            json_value,
+            json_value,
+        ],
+    ),
+    (
+        "JSON ARRAY",
+        JSONArray(
             [
                 [
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
+                    JSON(json_value),
                 ],
                 [
-                    {
-                        "test": ["something", 123, "here"],
-                        "nested": ["JSON"],
-                    },
+                    JSON(json_value),
                 ],
             ],
         ),
-        (
-            "JSON ARRAY",
-            JSONArray(
-                [
-                    JSON([{"array": "json"}, {"one more": "test"}]),
-                    JSON([{"array": "json"}, {"one more": "test"}]),
-                ],
-            ),
+        [
             [
-                [{"array": "json"}, {"one more": "test"}],
-                [{"array": "json"}, {"one more": "test"}],
+                json_value,
             ],
-        ),
-        (
-            "JSON ARRAY",
-            JSONArray(
-                [
-                    JSON([[{"array": "json"}], [{"one more": "test"}]]),
-                    JSON([[{"array": "json"}], [{"one more": "test"}]]),
-                ],
-            ),
             [
-                [[{"array": "json"}], [{"one more": "test"}]],
-                [[{"array": "json"}], [{"one more": "test"}]],
+                json_value,
             ],
-        ),
-        (
-            "POINT ARRAY",
+        ],
+    ),
+    (
+        "JSON ARRAY",
+        JSONArray(
             [
-                Point([1.5, 2]),
-                Point([2, 3]),
+                JSON([{"array": "json"}, {"one more": "test"}]),
+                JSON([{"array": "json"}, {"one more": "test"}]),
             ],
+        ),
+        [
+            [{"array": "json"}, {"one more": "test"}],
+            [{"array": "json"}, {"one more": "test"}],
+        ],
+    ),
+    (
+        "JSON ARRAY",
+        JSONArray(
             [
-                (1.5, 2.0),
-                (2.0, 3.0),
+                JSON([[{"array": "json"}], [{"one more": "test"}]]),
+                JSON([[{"array": "json"}], [{"one more": "test"}]]),
             ],
         ),
-        (
-            "POINT ARRAY",
-            PointArray(
-                [
-                    Point([1.5, 2]),
-                    Point([2, 3]),
-                ],
-            ),
+        [
+            [[{"array": "json"}], [{"one more": "test"}]],
+            [[{"array": "json"}], [{"one more": "test"}]],
+        ],
+    ),
+    (
+        "POINT ARRAY",
+        [
+            Point([1.5, 2]),
+            Point([2, 3]),
+        ],
+        [
+            (1.5, 2.0),
+            (2.0, 3.0),
+        ],
+    ),
+    (
+        "POINT ARRAY",
+        PointArray(
             [
-                (1.5, 2.0),
-                (2.0, 3.0),
+                Point([1.5, 2]),
+                Point([2, 3]),
             ],
         ),
-        (
-            "POINT ARRAY",
+        [
+            (1.5, 2.0),
+            (2.0, 3.0),
+        ],
+    ),
+    (
+        "POINT ARRAY",
+        [
+            [Point([1.5, 2])],
+            [Point([2, 3])],
+        ],
+        [
+            [(1.5, 2.0)],
+            [(2.0, 3.0)],
+        ],
+    ),
+    (
+        "POINT ARRAY",
+        PointArray(
             [
                 [Point([1.5, 2])],
                 [Point([2, 3])],
             ],
-            [
-                [(1.5, 2.0)],
-                [(2.0, 3.0)],
-            ],
         ),
-        (
-            "POINT ARRAY",
-            PointArray(
-                [
-                    [Point([1.5, 2])],
-                    [Point([2, 3])],
-                ],
-            ),
-            [
-                [(1.5, 2.0)],
-                [(2.0, 3.0)],
-            ],
-        ),
-        ("BOX ARRAY", [], []),
-        (
-            "BOX ARRAY",
+        [
+            [(1.5, 2.0)],
+            [(2.0, 3.0)],
+        ],
+    ),
+    ("BOX ARRAY", [], []),
+    (
+        "BOX ARRAY",
+        [
+            Box([3.5, 3, 9, 9]),
+            Box([8.5, 8, 9, 9]),
+        ],
+        [
+            ((9.0, 9.0), (3.5, 3.0)),
+            ((9.0, 9.0), (8.5, 8.0)),
+        ],
+    ),
+    (
+        "BOX ARRAY",
+        BoxArray(
             [
                 Box([3.5, 3, 9, 9]),
                 Box([8.5, 8, 9, 9]),
             ],
-            [
-                ((9.0, 9.0), (3.5, 3.0)),
-                ((9.0, 9.0), (8.5, 8.0)),
-            ],
-        ),
-        (
-            "BOX ARRAY",
-            BoxArray(
-                [
-                    Box([3.5, 3, 9, 9]),
-                    Box([8.5, 8, 9, 9]),
-                ],
-            ),
-            [
-                ((9.0, 9.0), (3.5, 3.0)),
-                ((9.0, 9.0), (8.5, 8.0)),
-            ],
         ),
-        (
-            "BOX ARRAY",
-            BoxArray(
-                [
-                    [Box([3.5, 3, 9, 9])],
-                    [Box([8.5, 8, 9, 9])],
-                ],
-            ),
+        [
+            ((9.0, 9.0), (3.5, 3.0)),
+            ((9.0, 9.0), (8.5, 8.0)),
+        ],
+    ),
+    (
+        "BOX ARRAY",
+        BoxArray(
             [
-                [((9.0, 9.0), (3.5, 3.0))],
-                [((9.0, 9.0), (8.5, 8.0))],
+                [Box([3.5, 3, 9, 9])],
+                [Box([8.5, 8, 9, 9])],
             ],
         ),
-        ("PATH ARRAY", [], []),
-        (
-            "PATH ARRAY",
+        [
+            [((9.0, 9.0), (3.5, 3.0))],
+            [((9.0, 9.0), (8.5, 8.0))],
+        ],
+    ),
+    ("PATH ARRAY", [], []),
+    (
+        "PATH ARRAY",
+        [
+            Path([(3.5, 3), (9, 9), (8, 8)]),
+            Path([(3.5, 3), (6, 6), (3.5, 3)]),
+        ],
+        [
+            [(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)],
+            ((3.5, 3.0), (6.0, 6.0), (3.5, 3.0)),
+        ],
+    ),
+    (
+        "PATH ARRAY",
+        PathArray(
             [
                 Path([(3.5, 3), (9, 9), (8, 8)]),
                 Path([(3.5, 3), (6, 6), (3.5, 3)]),
             ],
-            [
-                [(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)],
-                ((3.5, 3.0), (6.0, 6.0), (3.5, 3.0)),
-            ],
-        ),
-        (
-            "PATH ARRAY",
-            PathArray(
-                [
-                    Path([(3.5, 3), (9, 9), (8, 8)]),
-                    Path([(3.5, 3), (6, 6), (3.5, 3)]),
-                ],
-            ),
-            [
-                [(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)],
-                ((3.5, 3.0), (6.0, 6.0), (3.5, 3.0)),
-            ],
         ),
-        (
-            "PATH ARRAY",
+        [
+            [(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)],
+            ((3.5, 3.0), (6.0, 6.0), (3.5, 3.0)),
+        ],
+    ),
+    (
+        "PATH ARRAY",
+        [
+            [Path([(3.5, 3), (9, 9), (8, 8)])],
+            [Path([(3.5, 3), (6, 6), (3.5, 3)])],
+        ],
+        [
+            [[(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)]],
+            [((3.5, 3.0), (6.0, 6.0), (3.5, 3.0))],
+        ],
+    ),
+    (
+        "PATH ARRAY",
+        PathArray(
             [
                 [Path([(3.5, 3), (9, 9), (8, 8)])],
                 [Path([(3.5, 3), (6, 6), (3.5, 3)])],
             ],
-            [
-                [[(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)]],
-                [((3.5, 3.0), (6.0, 6.0), (3.5, 3.0))],
-            ],
         ),
-        (
-            "PATH ARRAY",
-            PathArray(
-                [
-                    [Path([(3.5, 3), (9, 9), (8, 8)])],
-                    [Path([(3.5, 3), (6, 6), (3.5, 3)])],
-                ],
-            ),
-            [
-                [[(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)]],
-                [((3.5, 3.0), (6.0, 6.0), (3.5, 3.0))],
-            ],
-        ),
-        ("LINE ARRAY", [], []),
-        (
-            "LINE ARRAY",
+        [
+            [[(3.5, 3.0), (9.0, 9.0), (8.0, 8.0)]],
+            [((3.5, 3.0), (6.0, 6.0), (3.5, 3.0))],
+        ],
+    ),
+    ("LINE ARRAY", [], []),
+    (
+        "LINE ARRAY",
+        [
+            Line([-2, 1, 2]),
+            Line([1, -2, 3]),
+        ],
+        [
+            (-2.0, 1.0, 2.0),
+            (1.0, -2.0, 3.0),
+        ],
+    ),
+    (
+        "LINE ARRAY",
+        LineArray(
             [
                 Line([-2, 1, 2]),
                 Line([1, -2, 3]),
             ],
-            [
-                (-2.0, 1.0, 2.0),
-                (1.0, -2.0, 3.0),
-            ],
-        ),
-        (
-            "LINE ARRAY",
-            LineArray(
-                [
-                    Line([-2, 1, 2]),
-                    Line([1, -2, 3]),
-                ],
-            ),
-            [
-                (-2.0, 1.0, 2.0),
-                (1.0, -2.0, 3.0),
-            ],
         ),
-        (
-            "LINE ARRAY",
+        [
+            (-2.0, 1.0, 2.0),
+            (1.0, -2.0, 3.0),
+        ],
+    ),
+    (
+        "LINE ARRAY",
+        [
+            [Line([-2, 1, 2])],
+            [Line([1, -2, 3])],
+        ],
+        [
+            [(-2.0, 1.0, 2.0)],
+            [(1.0, -2.0, 3.0)],
+        ],
+    ),
+    (
+        "LINE ARRAY",
+        LineArray(
             [
                 [Line([-2, 1, 2])],
                 [Line([1, -2, 3])],
             ],
-            [
-                [(-2.0, 1.0, 2.0)],
-                [(1.0, -2.0, 3.0)],
-            ],
-        ),
-        (
-            "LINE ARRAY",
-            LineArray(
-                [
-                    [Line([-2, 1, 2])],
-                    [Line([1, -2, 3])],
-                ],
-            ),
-            [
-                [(-2.0, 1.0, 2.0)],
-                [(1.0, -2.0, 3.0)],
-            ],
         ),
-        ("LSEG ARRAY", [], []),
-        (
-            "LSEG ARRAY",
+        [
+            [(-2.0, 1.0, 2.0)],
+            [(1.0, -2.0, 3.0)],
+        ],
+    ),
+    ("LSEG ARRAY", [], []),
+    (
+        "LSEG ARRAY",
+        [
+            LineSegment({(1, 2), (9, 9)}),
+            LineSegment([(5.6, 3.1), (4, 5)]),
+        ],
+        [
+            [(1.0, 2.0), (9.0, 9.0)],
+            [(5.6, 3.1), (4.0, 5.0)],
+        ],
+    ),
+    (
+        "LSEG ARRAY",
+        LsegArray(
             [
                 LineSegment({(1, 2), (9, 9)}),
                 LineSegment([(5.6, 3.1), (4, 5)]),
             ],
-            [
-                [(1.0, 2.0), (9.0, 9.0)],
-                [(5.6, 3.1), (4.0, 5.0)],
-            ],
-        ),
-        (
-            "LSEG ARRAY",
-            LsegArray(
-                [
-                    LineSegment({(1, 2), (9, 9)}),
-                    LineSegment([(5.6, 3.1), (4, 5)]),
-                ],
-            ),
-            [
-                [(1.0, 2.0), (9.0, 9.0)],
-                [(5.6, 3.1), (4.0, 5.0)],
-            ],
         ),
-        (
-            "LSEG ARRAY",
+        [
+            [(1.0, 2.0), (9.0, 9.0)],
+            [(5.6, 3.1), (4.0, 5.0)],
+        ],
+    ),
+    (
+        "LSEG ARRAY",
+        [
+            [LineSegment({(1, 2), (9, 9)})],
+            [LineSegment([(5.6, 3.1), (4, 5)])],
+        ],
+        [
+            [[(1.0, 2.0), (9.0, 9.0)]],
+            [[(5.6, 3.1), (4.0, 5.0)]],
+        ],
+    ),
+    (
+        "LSEG ARRAY",
+        LsegArray(
             [
                 [LineSegment({(1, 2), (9, 9)})],
                 [LineSegment([(5.6, 3.1), (4, 5)])],
             ],
-            [
-                [[(1.0, 2.0), (9.0, 9.0)]],
-                [[(5.6, 3.1), (4.0, 5.0)]],
-            ],
         ),
-        (
-            "LSEG ARRAY",
-            LsegArray(
-                [
-                    [LineSegment({(1, 2), (9, 9)})],
-                    [LineSegment([(5.6, 3.1), (4, 5)])],
-                ],
-            ),
-            [
-                [[(1.0, 2.0), (9.0, 9.0)]],
-                [[(5.6, 3.1), (4.0, 5.0)]],
-            ],
-        ),
-        ("CIRCLE ARRAY", [], []),
-        (
-            "CIRCLE ARRAY",
+        [
+            [[(1.0, 2.0), (9.0, 9.0)]],
+            [[(5.6, 3.1), (4.0, 5.0)]],
+        ],
+    ),
+    ("CIRCLE ARRAY", [], []),
+    (
+        "CIRCLE ARRAY",
+        [
+            Circle([1.7, 2.8, 3]),
+            Circle([5, 1.8, 10]),
+        ],
+        [
+            ((1.7, 2.8), 3.0),
+            ((5.0, 1.8), 10.0),
+        ],
+    ),
+    (
+        "CIRCLE ARRAY",
+        CircleArray(
             [
                 Circle([1.7, 2.8, 3]),
                 Circle([5, 1.8, 10]),
             ],
-            [
-                ((1.7, 2.8), 3.0),
-                ((5.0, 1.8), 10.0),
-            ],
-        ),
-        (
-            "CIRCLE ARRAY",
-            CircleArray(
-                [
-                    Circle([1.7, 2.8, 3]),
-                    Circle([5, 1.8, 10]),
-                ],
-            ),
-            [
-                ((1.7, 2.8), 3.0),
-                ((5.0, 1.8), 10.0),
-            ],
-        ),
-        (
-            "CIRCLE ARRAY",
-            CircleArray(
-                [
-                    [Circle([1.7, 2.8, 3])],
-                    [Circle([5, 1.8, 10])],
-                ],
-            ),
-            [
-                [((1.7, 2.8), 3.0)],
-                [((5.0, 1.8), 10.0)],
-            ],
         ),
-        ("INTERVAL ARRAY", [], []),
-        (
-            "INTERVAL ARRAY",
-            [
-                [datetime.timedelta(days=100, microseconds=100)],
-                [datetime.timedelta(days=100, microseconds=100)],
-            ],
+        [
+            ((1.7, 2.8), 3.0),
+            ((5.0, 1.8), 10.0),
+        ],
+    ),
+    (
+        "CIRCLE ARRAY",
+        CircleArray(
             [
-                [datetime.timedelta(days=100, microseconds=100)],
-                [datetime.timedelta(days=100, microseconds=100)],
+                [Circle([1.7, 2.8, 3])],
+                [Circle([5, 1.8, 10])],
             ],
         ),
-        (
-            "INTERVAL ARRAY",
-            IntervalArray(
-                [
-                    [datetime.timedelta(days=100, microseconds=100)],
-                    [datetime.timedelta(days=100, microseconds=100)],
-                ],
-            ),
+        [
+            [((1.7, 2.8), 3.0)],
+            [((5.0, 1.8), 10.0)],
+        ],
+    ),
+    ("INTERVAL ARRAY", [], []),
+    (
+        "INTERVAL ARRAY",
+        [
+            [interval_value],
+            [interval_value],
+        ],
+        [
+            [interval_value],
+            [interval_value],
+        ],
+    ),
+    (
+        "INTERVAL ARRAY",
+        IntervalArray(
             [
-                [datetime.timedelta(days=100, microseconds=100)],
-                [datetime.timedelta(days=100, microseconds=100)],
+                [interval_value],
+                [interval_value],
             ],
         ),
-    ],
+        [
+            [interval_value],
+            [interval_value],
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("postgres_type", "py_value", "expected_deserialized"),
+    ARRAY_TYPE_CASES,
+    ids=_case_ids(ARRAY_TYPE_CASES),
 )
 async def test_array_types(
-    psql_pool: ConnectionPool,
+    module_conn: Connection,
     postgres_type: str,
     py_value: Any,
     expected_deserialized: Any,
 ) -> None:
-    async with psql_pool.acquire() as conn:
-        await conn.execute("DROP TABLE IF EXISTS for_test")
-        create_table_query = f"""
-        CREATE TABLE for_test (test_field {postgres_type})
-        """
-        insert_data_query = """
-        INSERT INTO for_test VALUES ($1)
-        """
-        await conn.execute(querystring=create_table_query)
-        await conn.execute(
-            querystring=insert_data_query,
-            parameters=[py_value],
-        )
+    """Test how ARRAY types can cast from Python and to Python.
 
-        raw_result = await conn.execute(
-            querystring="SELECT test_field FROM for_test",
-        )
+    Like simple types, value is sent as a parameter and selected back.
+    """
+    raw_result = await module_conn.execute(
+        querystring=f"SELECT $1::{postgres_type} AS test_field",
+        parameters=[py_value],
+    )
 
-        assert raw_result.result()[0]["test_field"] == expected_deserialized
+    assert raw_result.value() == expected_deserialized
@@ -1,5 +1,8 @@
 use bytes::Buf;
-use futures::stream::{FuturesOrdered, Stream, StreamExt};
+use futures::{
+    future,
+    stream::{FuturesOrdered, Stream, StreamExt},
+};
 use postgres_types::{ToSql, Type};
 use pyo3::{PyAny, Python};
 use tokio_postgres::{CopyInSink, Portal as tp_Portal, Row, Statement, ToStatement};
@@ -9,7 +12,9 @@ use crate::{
     options::{IsolationLevel, ReadVariant},
     query_result::{PSQLDriverPyQueryResult, PSQLDriverSinglePyQueryResult},
     statement::{
-        parameters::ParametersBuilder, statement::PsqlpyStatement,
+        parameters::{ParametersBuilder, PreparedParameters},
+        query::InsertValuesTemplate,
+        statement::PsqlpyStatement,
         statement_builder::StatementBuilder,
     },
     transaction::structs::PSQLPyTransaction,
@@ -467,6 +472,58 @@ impl PSQLPyConnection {
         Ok(PSQLDriverPyQueryResult::new(return_result))
     }
 
+    /// Start transaction and execute the first query in it.
+    ///
+    /// Transaction start statement and the query are sent
+    /// without waiting for each other, so it takes
+    /// one round-trip less than `start_transaction` + `execute`.
+    /// If the transaction can't be started, the error says
+    /// whether the query was executed outside of it.
+    ///
+    /// # Errors
+    /// May return error if there is some problem with DB communication.
+    pub async fn start_transaction_with(
+        &mut self,
+        isolation_level: Option<IsolationLevel>,
+        read_variant: Option<ReadVariant>,
+        deferrable: Option<bool>,
+        querystring: String,
+        parameters: Option<pyo3::Py<PyAny>>,
+        prepared: Option<bool>,
+    ) -> PSQLPyResult<PSQLDriverPyQueryResult> {
+        if self.in_transaction() {
+            return Err(RustPSQLDriverError::TransactionBeginError(
+                "Transaction is already started".into(),
+            ));
+        }
+
+        let start_qs = self.build_start_qs(isolation_level, read_variant, deferrable);
+        let (start_result, query_result) = future::join(
+            self.batch_execute(&start_qs),
+            self.execute(querystring, parameters, prepared),
+        )
+        .await;
+
+        if let Err(err) = start_result {
+            // The query doesn't wait for the transaction start,
+            // so it could have been executed outside of the transaction.
+            let query_state = if query_result.is_ok() {
+                "query was executed outside of the transaction"
+            } else {
+                "query wasn't executed"
+            };
+            return Err(RustPSQLDriverError::TransactionBeginError(format!(
+                "Cannot start transaction due to - {err}, {query_state}"
+            )));
+        }
+        match self {
+            PSQLPyConnection::PoolConn(conn) => conn.in_transaction = true,
+            PSQLPyConnection::SingleConnection(conn) => conn.in_transaction = true,
+        }
+
+        query_result
+    }
+
     /// Execute many queries without return.
     ///
     /// ## Performance model
@@ -531,6 +588,14 @@ impl PSQLPyConnection {
     /// `transaction.rollback()` should be updated to omit that call** —
     /// the outer transaction is still usable after a batch failure.
     ///
+    /// ## Multi-row `INSERT`
+    ///
+    /// With `fast_executemany` a plain `INSERT ... VALUES ($1, ...)` is
+    /// rewritten into one `INSERT ... VALUES (...), (...), ...` with
+    /// renumbered placeholders, so all parameter sets go in a single
+    /// statement (split only at the 65535 bind parameters limit).
+    /// Any other querystring falls back to the pipelined path.
+    ///
     /// # Errors
     /// May return error if there is some problem with DB communication.
     pub async fn execute_many(
@@ -538,6 +603,7 @@ impl PSQLPyConnection {
         querystring: String,
         parameters: Option<Vec<pyo3::Py<PyAny>>>,
         prepared: Option<bool>,
+        fast_executemany: Option<bool>,
     ) -> PSQLPyResult<()> {
         let Some(parameters) = parameters else {
             return Ok(());
@@ -547,14 +613,17 @@ impl PSQLPyConnection {
         }
 
         let prepared = prepared.unwrap_or(true);
+        let fast_executemany = fast_executemany.unwrap_or(false);
 
         // Build statement once using the first param set to resolve types and
         // (for the prepared path) obtain the server-side Statement handle.
+        // With `fast_executemany` the single-row statement is only used
+        // to resolve types, so it isn't kept prepared.
         let template = StatementBuilder::new(
             &querystring,
             &Some(parameters[0].clone()),
             self,
-            Some(prepared),
+            Some(prepared && !fast_executemany),
         )
         .build()
         .await
@@ -564,13 +633,19 @@ impl PSQLPyConnection {
             ))
         })?;
 
-        let prepared_stmt: Option<Statement> = if prepared {
-            Some(template.statement_query()?.clone())
+        let param_types: Vec<Type> = template.param_types().to_vec();
+        let raw_query = template.raw_query().to_string();
+        let values_template = if fast_executemany {
+            InsertValuesTemplate::parse(&raw_query, param_types.len())
         } else {
             None
         };
-        let param_types: Vec<Type> = template.param_types().to_vec();
-        let raw_query = template.raw_query().to_string();
+
+        let prepared_stmt: Option<Statement> = match (prepared, &values_template) {
+            (false, _) | (true, Some(_)) => None,
+            (true, None) if fast_executemany => Some(self.prepare(&raw_query, true).await?),
+            (true, None) => Some(template.statement_query()?.clone()),
+        };
         // Named-parameter names are already computed inside StatementBuilder::build().
         let param_names: Option<Vec<String>> = template.param_names().map(<[_]>::to_vec);
 
@@ -606,9 +681,16 @@ impl PSQLPyConnection {
             ))
         })?;
 
-        let batch_result = self
-            .run_pipelined_batch(prepared_stmt.as_ref(), &raw_query, &all_pp, prepared)
-            .await;
+        let batch_result = match &values_template {
+            Some(values_template) => {
+                self.run_values_batch(values_template, &all_pp, prepared)
+                    .await
+            }
+            None => {
+                self.run_pipelined_batch(prepared_stmt.as_ref(), &raw_query, &all_pp, prepared)
+                    .await
+            }
+        };
 
         let close_sql = wrap.close_sql(batch_result.is_ok());
         let close_result = self.batch_execute(close_sql).await;
@@ -658,7 +740,7 @@ impl PSQLPyConnection {
         &self,
         prepared_stmt: Option<&Statement>,
         raw_query: &str,
-        all_params: &[crate::statement::parameters::PreparedParameters],
+        all_params: &[PreparedParameters],
         prepared: bool,
     ) -> PSQLPyResult<()> {
         if prepared {
@@ -684,6 +766,65 @@ impl PSQLPyConnection {
         }
     }
 
+    /// Send the bound parameter sets as multi-row `INSERT` statements.
+    ///
+    /// Parameter sets are grouped so that every statement stays below
+    /// the bind parameters limit, usually it's a single statement.
+    ///
+    /// With `prepared` only the statement for a full group is prepared,
+    /// once per call. A group with fewer rows is rendered for that exact
+    /// number of rows and wouldn't be reused, so it's sent unprepared
+    /// instead of adding a new statement to the cache.
+    async fn run_values_batch(
+        &self,
+        values_template: &InsertValuesTemplate,
+        all_params: &[PreparedParameters],
+        prepared: bool,
+    ) -> PSQLPyResult<()> {
+        let rows_per_statement = values_template.rows_per_statement();
+        let mut full_chunk_stmt: Option<Statement> = None;
+
+        for params_chunk in all_params.chunks(rows_per_statement) {
+            let querystring = values_template.render(params_chunk.len());
+
+            let result = if prepared && params_chunk.len() == rows_per_statement {
+                let stmt = match &full_chunk_stmt {
+                    Some(stmt) => stmt.clone(),
+                    None => {
+                        let stmt = self.prepare(&querystring, true).await?;
+                        full_chunk_stmt = Some(stmt.clone());
+                        stmt
+                    }
+                };
+                let param_boxes: Vec<Box<[&(dyn ToSql + Sync)]>> = params_chunk
+                    .iter()
+                    .map(PreparedParameters::params)
+                    .collect();
+                let params: Vec<&(dyn ToSql + Sync)> =
+                    param_boxes.iter().flat_map(|p| p.iter().copied()).collect();
+
+                self.query(&stmt, &params).await
+            } else {
+                let param_boxes: Vec<Box<[(&(dyn ToSql + Sync), Type)]>> = params_chunk
+                    .iter()
+                    .map(PreparedParameters::params_typed)
+                    .collect();
+                let params: Vec<(&(dyn ToSql + Sync), Type)> =
+                    param_boxes.iter().flat_map(|p| p.iter().cloned()).collect();
+
+                self.query_typed(&querystring, &params).await
+            };
+
+            result.map_err(|err| {
+                RustPSQLDriverError::ConnectionExecuteError(format!(
+                    "Error occurred in `execute_many` statement: {err}"
+                ))
+            })?;
+        }
+
+        Ok(())
+    }
+
     /// Execute raw query with parameters. Return one raw row
     ///
     /// # Errors
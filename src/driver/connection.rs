@@ -282,12 +282,13 @@ impl Connection {
     /// May return Err Result if:
     /// 1) Cannot convert python parameters
     /// 2) Cannot execute querystring.
-    #[pyo3(signature = (querystring, parameters=None, prepared=None))]
+    #[pyo3(signature = (querystring, parameters=None, prepared=None, fast_executemany=None))]
     pub async fn execute_many(
         self_: pyo3::Py<Self>,
         querystring: String,
         parameters: Option<Vec<Py<PyAny>>>,
         prepared: Option<bool>,
+        fast_executemany: Option<bool>,
     ) -> PSQLPyResult<Py<PyAny>> {
         let (db_client, py_none) =
             pyo3::Python::with_gil(|gil| (self_.borrow(gil).conn.clone(), gil.None().into_any()));
@@ -295,7 +296,7 @@ impl Connection {
         if let Some(db_client) = db_client {
             let read_conn_g = db_client.read().await;
             read_conn_g
-                .execute_many(querystring, parameters, prepared)
+                .execute_many(querystring, parameters, prepared, fast_executemany)
                 .await?;
 
             return Ok(py_none);
@@ -162,7 +162,7 @@ pub fn connect_pool(
     ))
 }
 
-#[pyclass]
+#[pyclass(frozen, get_all)]
 #[allow(clippy::module_name_repetitions)]
 pub struct ConnectionPoolStatus {
     /// The maximum size of the pool.
@@ -191,26 +191,6 @@ impl ConnectionPoolStatus {
 
 #[pymethods]
 impl ConnectionPoolStatus {
-    #[getter]
-    fn get_max_size(&self) -> usize {
-        self.max_size
-    }
-
-    #[getter]
-    fn get_size(&self) -> usize {
-        self.size
-    }
-
-    #[getter]
-    fn get_available(&self) -> usize {
-        self.available
-    }
-
-    #[getter]
-    fn get_waiting(&self) -> usize {
-        self.waiting
-    }
-
     fn __str__(&self) -> String {
         format!(
             "Connection Pool Status - [max_size: {}, size: {}, available: {}, waiting: {}]",
@@ -5,5 +5,6 @@ pub mod connection_pool_builder;
 pub mod cursor;
 pub mod listener;
 pub mod prepared_statement;
+pub mod savepoint;
 pub mod transaction;
 pub mod utils;
@@ -1,6 +1,6 @@
 use std::sync::Arc;
 
-use pyo3::{pyclass, pymethods};
+use pyo3::{pyclass, pymethods, Py, PyAny};
 use tokio::sync::RwLock;
 use tokio_postgres::Config;
 
@@ -38,13 +38,24 @@ impl PreparedStatement {
 
 #[pymethods]
 impl PreparedStatement {
-    async fn execute(&self) -> PSQLPyResult<PSQLDriverPyQueryResult> {
+    #[pyo3(signature = (parameters=None))]
+    async fn execute(
+        &self,
+        parameters: Option<Py<PyAny>>,
+    ) -> PSQLPyResult<PSQLDriverPyQueryResult> {
         let Some(conn) = &self.conn else {
             return Err(RustPSQLDriverError::TransactionClosedError);
         };
 
         let read_conn_g = conn.read().await;
-        read_conn_g.execute_statement(&self.statement).await
+        match parameters {
+            Some(parameters) => {
+                read_conn_g
+                    .execute_statement(&self.statement.bind(&parameters)?)
+                    .await
+            }
+            None => read_conn_g.execute_statement(&self.statement).await,
+        }
     }
 
     fn cursor(&self) -> Cursor {
@@ -0,0 +1,130 @@
+use std::sync::{
+    atomic::{AtomicBool, Ordering},
+    Arc,
+};
+
+use futures::future;
+use pyo3::{pyclass, pymethods, Py, PyAny, PyErr};
+use tokio::sync::RwLock;
+
+use crate::{
+    connection::{structs::PSQLPyConnection, traits::Connection as _},
+    exceptions::rust_errors::{PSQLPyResult, RustPSQLDriverError},
+    query_result::PSQLDriverPyQueryResult,
+};
+
+/// Savepoint bound to an async context manager.
+///
+/// `SAVEPOINT` is not sent on `__aenter__`, it is queued together
+/// with the first `execute` on the scope, so both statements
+/// go to the server without waiting for each other.
+/// On `__aexit__` the savepoint is released, or rolled back
+/// and released in a single batch if the body raised.
+/// If nothing was executed through the scope, no statements are sent at all.
+///
+/// The scope is frozen and keeps its state behind a lock and an atomic flag,
+/// so `__aexit__` can run while an `execute` on the scope is still pending.
+#[pyclass(frozen)]
+#[derive(Debug)]
+pub struct SavepointScope {
+    conn: RwLock<Option<Arc<RwLock<PSQLPyConnection>>>>,
+    savepoint_name: String,
+    is_opened: AtomicBool,
+}
+
+impl SavepointScope {
+    #[must_use]
+    pub fn new(conn: Option<Arc<RwLock<PSQLPyConnection>>>, savepoint_name: String) -> Self {
+        Self {
+            conn: RwLock::new(conn),
+            savepoint_name,
+            is_opened: AtomicBool::new(false),
+        }
+    }
+}
+
+#[pymethods]
+impl SavepointScope {
+    async fn __aenter__(self_: Py<Self>) -> PSQLPyResult<Py<Self>> {
+        if self_.get().conn.read().await.is_none() {
+            return Err(RustPSQLDriverError::TransactionClosedError);
+        }
+
+        Ok(self_)
+    }
+
+    #[allow(clippy::needless_pass_by_value)]
+    async fn __aexit__(
+        self_: Py<Self>,
+        _exception_type: Py<PyAny>,
+        exception: Py<PyAny>,
+        _traceback: Py<PyAny>,
+    ) -> PSQLPyResult<()> {
+        let (is_exception_none, py_err) = pyo3::Python::with_gil(|gil| {
+            (
+                exception.is_none(gil),
+                PyErr::from_value(exception.into_bound(gil)),
+            )
+        });
+
+        let scope = self_.get();
+        let Some(conn) = scope.conn.write().await.take() else {
+            return Err(RustPSQLDriverError::TransactionClosedError);
+        };
+
+        if scope.is_opened.load(Ordering::Acquire) {
+            let savepoint_name = &scope.savepoint_name;
+            let close_qs = if is_exception_none {
+                format!("RELEASE SAVEPOINT {savepoint_name}")
+            } else {
+                format!(
+                    "ROLLBACK TO SAVEPOINT {savepoint_name}; RELEASE SAVEPOINT {savepoint_name}"
+                )
+            };
+            let read_conn_g = conn.read().await;
+            read_conn_g.batch_execute(&close_qs).await?;
+        }
+
+        if is_exception_none {
+            Ok(())
+        } else {
+            Err(RustPSQLDriverError::RustPyError(py_err))
+        }
+    }
+
+    /// Execute querystring with parameters inside the savepoint.
+    ///
+    /// The first call sends `SAVEPOINT` and the query together.
+    ///
+    /// # Errors
+    /// Can return error if there is a problem with DB communication.
+    #[pyo3(signature = (querystring, parameters=None, prepared=None))]
+    pub async fn execute(
+        &self,
+        querystring: String,
+        parameters: Option<pyo3::Py<PyAny>>,
+        prepared: Option<bool>,
+    ) -> PSQLPyResult<PSQLDriverPyQueryResult> {
+        let Some(conn) = self.conn.read().await.clone() else {
+            return Err(RustPSQLDriverError::TransactionClosedError);
+        };
+
+        let read_conn_g = conn.read().await;
+        if self.is_opened.swap(true, Ordering::AcqRel) {
+            return read_conn_g.execute(querystring, parameters, prepared).await;
+        }
+
+        let savepoint_qs = format!("SAVEPOINT {}", self.savepoint_name);
+        let (savepoint_result, query_result) = future::join(
+            read_conn_g.batch_execute(&savepoint_qs),
+            read_conn_g.execute(querystring, parameters, prepared),
+        )
+        .await;
+        if let Err(err) = savepoint_result {
+            self.is_opened.store(false, Ordering::Release);
+            return Err(err);
+        }
+
+        query_result
+    }
+}
@@ -19,6 +19,8 @@ use crate::{
     query_result::{PSQLDriverPyQueryResult, PSQLDriverSinglePyQueryResult},
 };
 
+use super::savepoint::SavepointScope;
+
 #[pyclass(subclass)]
 #[derive(Debug)]
 pub struct Transaction {
@@ -136,6 +138,34 @@ impl Transaction {
         Ok(())
     }
 
+    /// Begin the transaction and execute querystring with parameters in it.
+    ///
+    /// # Errors
+    /// Can return error if there is a problem with DB communication.
+    #[pyo3(signature = (querystring, parameters=None, prepared=None))]
+    pub async fn begin_with(
+        &mut self,
+        querystring: String,
+        parameters: Option<pyo3::Py<PyAny>>,
+        prepared: Option<bool>,
+    ) -> PSQLPyResult<PSQLDriverPyQueryResult> {
+        let conn = &self.conn;
+        let Some(conn) = conn else {
+            return Err(RustPSQLDriverError::TransactionClosedError);
+        };
+        let mut write_conn_g = conn.write().await;
+        write_conn_g
+            .start_transaction_with(
+                self.isolation_level,
+                self.read_variant,
+                self.deferrable,
+                querystring,
+                parameters,
+                prepared,
+            )
+            .await
+    }
+
     /// Execute querystring with parameters.
     ///
     /// # Errors
@@ -217,12 +247,13 @@ impl Transaction {
     ///
     /// # Errors
     /// Can return error if there is a problem with DB communication.
-    #[pyo3(signature = (querystring, parameters=None, prepared=None))]
+    #[pyo3(signature = (querystring, parameters=None, prepared=None, fast_executemany=None))]
     pub async fn execute_many(
         &self,
         querystring: String,
         parameters: Option<Vec<Py<PyAny>>>,
         prepared: Option<bool>,
+        fast_executemany: Option<bool>,
     ) -> PSQLPyResult<()> {
         let Some(conn) = &self.conn else {
             return Err(RustPSQLDriverError::TransactionClosedError);
@@ -230,7 +261,7 @@ impl Transaction {
 
         let read_conn_g = conn.read().await;
         read_conn_g
-            .execute_many(querystring, parameters, prepared)
+            .execute_many(querystring, parameters, prepared, fast_executemany)
             .await
     }
 
@@ -306,6 +337,20 @@ impl Transaction {
         Ok(())
     }
 
+    /// Create new savepoint scope in a transaction.
+    ///
+    /// Must be used as an async context manager.
+    ///
+    /// # Errors
+    /// Can return error if transaction is already closed.
+    pub fn savepoint_scope(&self, savepoint_name: String) -> PSQLPyResult<SavepointScope> {
+        if self.conn.is_none() {
+            return Err(RustPSQLDriverError::TransactionClosedError);
+        }
+
+        Ok(SavepointScope::new(self.conn.clone(), savepoint_name))
+    }
+
     /// Execute many queries in a transaction.
     ///
     /// More information in a documentation:
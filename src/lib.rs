@@ -35,6 +35,7 @@ fn psqlpy(py: Python<'_>, pymod: &Bound<'_, PyModule>) -> PyResult<()> {
     pymod.add_class::<driver::connection::Connection>()?;
     pymod.add_function(wrap_pyfunction!(driver::connection::connect, pymod)?)?;
     pymod.add_class::<driver::transaction::Transaction>()?;
+    pymod.add_class::<driver::savepoint::SavepointScope>()?;
     // pymod.add_class::<driver::cursor::Cursor>()?;
     pymod.add_class::<statement::parameters::Column>()?;
     pymod.add_class::<driver::prepared_statement::PreparedStatement>()?;
@@ -1,14 +1,20 @@
 use std::{collections::HashMap, sync::Arc};
 
 use pyo3::{
+    exceptions::PyIndexError,
     prelude::*,
     pyclass, pymethods,
-    types::{PyDict, PyIterator, PyList, PySlice, PyTuple},
+    types::{PyDict, PyIterator, PyList, PySlice, PyString, PyTuple},
     IntoPyObjectExt, Py, PyAny, Python,
 };
 use tokio_postgres::Row;
 
-use crate::{exceptions::rust_errors::PSQLPyResult, value_converter::to_python::postgres_to_py};
+use crate::{
+    exceptions::rust_errors::{PSQLPyResult, RustPSQLDriverError},
+    value_converter::to_python::{
+        column_custom_decoder, postgres_to_py, postgres_to_py_with_decoder,
+    },
+};
 
 /// Convert postgres `Row` into Python Dict.
 ///
@@ -26,11 +32,112 @@ fn row_to_dict<'a>(
     let python_dict = PyDict::new(py);
     for (column_idx, column) in postgres_row.columns().iter().enumerate() {
         let python_type = postgres_to_py(py, postgres_row, column, column_idx, custom_decoders)?;
-        python_dict.set_item(column.name().into_py_any(py)?, python_type)?;
+        python_dict.set_item(PyString::intern(py, column.name()), python_type)?;
+    }
+    Ok(python_dict)
+}
+
+/// Column data shared by all rows of one result.
+///
+/// Column names are converted into Python strings
+/// and custom decoders are looked up once per column instead of once per value.
+/// Names are interned, so keys are shared between results of the same query
+/// and lookups with string literals from Python code compare by identity.
+struct ResultColumns<'py> {
+    keys: Vec<Bound<'py, PyString>>,
+    decoders: Vec<Option<Bound<'py, PyAny>>>,
+}
+
+impl<'py> ResultColumns<'py> {
+    #[allow(clippy::ref_option)]
+    fn new(py: Python<'py>, postgres_rows: &[Row], custom_decoders: &Option<Py<PyDict>>) -> Self {
+        let columns = postgres_rows.first().map(Row::columns).unwrap_or_default();
+        Self {
+            keys: columns
+                .iter()
+                .map(|column| PyString::intern(py, column.name()))
+                .collect(),
+            decoders: columns
+                .iter()
+                .map(|column| column_custom_decoder(py, column.name(), custom_decoders))
+                .collect(),
+        }
+    }
+}
+
+/// Convert postgres `Row` into Python Dict with already resolved columns.
+///
+/// # Errors
+///
+/// May return Err Result if can not convert
+/// postgres type to python or set new key-value pair
+/// in python dict.
+#[allow(clippy::ref_option)]
+fn row_to_dict_with_columns<'a>(
+    py: Python<'a>,
+    postgres_row: &Row,
+    result_columns: &ResultColumns<'a>,
+    custom_decoders: &Option<Py<PyDict>>,
+) -> PSQLPyResult<Bound<'a, PyDict>> {
+    let python_dict = PyDict::new(py);
+    for (column_idx, ((column, key), decoder)) in postgres_row
+        .columns()
+        .iter()
+        .zip(&result_columns.keys)
+        .zip(&result_columns.decoders)
+        .enumerate()
+    {
+        let python_type = postgres_to_py_with_decoder(
+            py,
+            postgres_row,
+            column,
+            column_idx,
+            decoder.as_ref(),
+            custom_decoders,
+        )?;
+        python_dict.set_item(key, python_type)?;
     }
     Ok(python_dict)
 }
 
+/// Convert postgres `Row` into Python Tuple with already resolved columns.
+///
+/// `tuple_items` is a buffer shared by all rows of the result,
+/// so it's allocated once, not for every row.
+///
+/// # Errors
+///
+/// May return Err Result if can not convert
+/// postgres type to python.
+#[allow(clippy::ref_option)]
+fn row_to_tuple_with_columns<'a>(
+    py: Python<'a>,
+    postgres_row: &Row,
+    result_columns: &ResultColumns<'a>,
+    custom_decoders: &Option<Py<PyDict>>,
+    tuple_items: &mut Vec<Py<PyAny>>,
+) -> PSQLPyResult<Bound<'a, PyTuple>> {
+    tuple_items.clear();
+
+    for (column_idx, (column, decoder)) in postgres_row
+        .columns()
+        .iter()
+        .zip(&result_columns.decoders)
+        .enumerate()
+    {
+        tuple_items.push(postgres_to_py_with_decoder(
+            py,
+            postgres_row,
+            column,
+            column_idx,
+            decoder.as_ref(),
+            custom_decoders,
+        )?);
+    }
+
+    Ok(PyTuple::new(py, tuple_items.drain(..))?)
+}
+
 /// Convert postgres `Row` into Python Tuple.
 ///
 /// # Errors
@@ -55,7 +162,7 @@ fn row_to_tuple<'a>(
     Ok(PyTuple::new(py, tuple_items)?)
 }
 
-#[pyclass(name = "QueryResult")]
+#[pyclass(frozen, name = "QueryResult")]
 #[allow(clippy::module_name_repetitions)]
 pub struct PSQLDriverPyQueryResult {
     pub inner: Vec<Row>,
@@ -97,21 +204,117 @@ impl PSQLDriverPyQueryResult {
     ) -> PSQLPyResult<Py<PyAny>> {
         let as_tuple = as_tuple.unwrap_or(false);
 
+        let result_columns = ResultColumns::new(py, &self.inner, &custom_decoders);
+
         if as_tuple {
-            let mut tuple_rows: Vec<Bound<'_, PyTuple>> = vec![];
+            let mut tuple_rows: Vec<Bound<'_, PyTuple>> = Vec::with_capacity(self.inner.len());
+            let mut tuple_items = Vec::with_capacity(result_columns.decoders.len());
             for row in &self.inner {
-                tuple_rows.push(row_to_tuple(py, row, &custom_decoders)?);
+                tuple_rows.push(row_to_tuple_with_columns(
+                    py,
+                    row,
+                    &result_columns,
+                    &custom_decoders,
+                    &mut tuple_items,
+                )?);
             }
             return Ok(tuple_rows.into_py_any(py)?);
         }
 
-        let mut dict_rows: Vec<Bound<'_, PyDict>> = vec![];
+        let mut dict_rows: Vec<Bound<'_, PyDict>> = Vec::with_capacity(self.inner.len());
         for row in &self.inner {
-            dict_rows.push(row_to_dict(py, row, &custom_decoders)?);
+            dict_rows.push(row_to_dict_with_columns(
+                py,
+                row,
+                &result_columns,
+                &custom_decoders,
+            )?);
         }
         Ok(dict_rows.into_py_any(py)?)
     }
 
+    /// Return number of rows in the result.
+    ///
+    /// Rows are not converted into Python objects.
+    #[must_use]
+    pub fn row_count(&self) -> usize {
+        self.inner.len()
+    }
+
+    /// Return result as a Python dict of column name to list of values.
+    ///
+    /// Values are converted column by column,
+    /// so one column is processed with the same decoder from start to end.
+    ///
+    /// # Errors
+    ///
+    /// May return Err Result if can not convert
+    /// postgres type to python or set new key-value pair
+    /// in python dict.
+    #[pyo3(signature = (custom_decoders=None))]
+    #[allow(clippy::needless_pass_by_value)]
+    pub fn columns(
+        &self,
+        py: Python<'_>,
+        custom_decoders: Option<Py<PyDict>>,
+    ) -> PSQLPyResult<Py<PyAny>> {
+        let result_columns = ResultColumns::new(py, &self.inner, &custom_decoders);
+        let python_dict = PyDict::new(py);
+
+        for (column_idx, (key, decoder)) in result_columns
+            .keys
+            .iter()
+            .zip(&result_columns.decoders)
+            .enumerate()
+        {
+            let mut column_values: Vec<Py<PyAny>> = Vec::with_capacity(self.inner.len());
+            for row in &self.inner {
+                column_values.push(postgres_to_py_with_decoder(
+                    py,
+                    row,
+                    &row.columns()[column_idx],
+                    column_idx,
+                    decoder.as_ref(),
+                    &custom_decoders,
+                )?);
+            }
+            python_dict.set_item(key, PyList::new(py, column_values)?)?;
+        }
+
+        Ok(python_dict.into_py_any(py)?)
+    }
+
+    /// Return one value from the result by row and column index.
+    ///
+    /// Only the requested value is converted into Python object.
+    ///
+    /// # Errors
+    ///
+    /// May return Err Result if row or column index is out of range
+    /// or if can not convert postgres type to python.
+    #[pyo3(signature = (row=0, column=0, custom_decoders=None))]
+    #[allow(clippy::needless_pass_by_value)]
+    pub fn value(
+        &self,
+        py: Python<'_>,
+        row: usize,
+        column: usize,
+        custom_decoders: Option<Py<PyDict>>,
+    ) -> PSQLPyResult<Py<PyAny>> {
+        let Some(postgres_row) = self.inner.get(row) else {
+            return Err(RustPSQLDriverError::RustPyError(PyIndexError::new_err(
+                format!("Row index {row} out of range"),
+            )));
+        };
+        let Some(postgres_column) = postgres_row.columns().get(column) else {
+            return Err(RustPSQLDriverError::RustPyError(PyIndexError::new_err(
+                format!("Column index {column} out of range"),
+            )));
+        };
+
+        postgres_to_py(py, postgres_row, postgres_column, column, &custom_decoders)
+    }
+
     /// Convert result from database to any class passed from Python.
     ///
     /// # Errors
@@ -120,9 +323,11 @@ impl PSQLDriverPyQueryResult {
     /// postgres type to python or create new Python class.
     #[allow(clippy::needless_pass_by_value)]
     pub fn as_class<'a>(&'a self, py: Python<'a>, as_class: Py<PyAny>) -> PSQLPyResult<Py<PyAny>> {
-        let mut result: Vec<Py<PyAny>> = vec![];
+        let result_columns = ResultColumns::new(py, &self.inner, &None);
+        let mut result: Vec<Py<PyAny>> = Vec::with_capacity(self.inner.len());
         for row in &self.inner {
-            let pydict: pyo3::Bound<'_, PyDict> = row_to_dict(py, row, &None)?;
+            let pydict: pyo3::Bound<'_, PyDict> =
+                row_to_dict_with_columns(py, row, &result_columns, &None)?;
             let convert_class_inst = as_class.call(py, (), Some(&pydict))?;
             result.push(convert_class_inst);
         }
@@ -144,9 +349,11 @@ impl PSQLDriverPyQueryResult {
         row_factory: Py<PyAny>,
         custom_decoders: Option<Py<PyDict>>,
     ) -> PSQLPyResult<Py<PyAny>> {
-        let mut result: Vec<Py<PyAny>> = vec![];
+        let result_columns = ResultColumns::new(py, &self.inner, &custom_decoders);
+        let mut result: Vec<Py<PyAny>> = Vec::with_capacity(self.inner.len());
         for row in &self.inner {
-            let pydict: pyo3::Bound<'_, PyDict> = row_to_dict(py, row, &custom_decoders)?;
+            let pydict: pyo3::Bound<'_, PyDict> =
+                row_to_dict_with_columns(py, row, &result_columns, &custom_decoders)?;
             let row_factory_class = row_factory.call(py, (pydict,), None)?;
             result.push(row_factory_class);
         }
@@ -202,7 +409,7 @@ impl PSQLDriverPyQueryResult {
     }
 }
 
-#[pyclass(name = "SingleQueryResult")]
+#[pyclass(frozen, name = "SingleQueryResult")]
 #[allow(clippy::module_name_repetitions)]
 pub struct PSQLDriverSinglePyQueryResult {
     inner: Row,
@@ -292,7 +499,7 @@ pub struct RecordDesc {
 ///
 /// Supports positional (`row[0]`) and by-name (`row["col"]`) access, iteration,
 /// and dict-like `.keys()` / `.values()` / `.items()` / `.get()`.
-#[pyclass(name = "Record")]
+#[pyclass(frozen, name = "Record")]
 pub struct Record {
     desc: Arc<RecordDesc>,
     values: Vec<Py<PyAny>>,
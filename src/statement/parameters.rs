@@ -233,7 +233,7 @@ impl MappingParametersBuilder {
         gil: Python<'_>,
         parameters_names: Vec<String>,
     ) -> PSQLPyResult<Vec<PyObject>> {
-        let mut params_as_pyobject: Vec<PyObject> = vec![];
+        let mut params_as_pyobject: Vec<PyObject> = Vec::with_capacity(parameters_names.len());
 
         for param_name in parameters_names {
             match self.map_parameters.bind(gil).get_item(&param_name) {
@@ -329,11 +329,9 @@ impl PreparedParameters {
 
     #[must_use]
     pub fn params_typed(&self) -> Box<[(&(dyn ToSql + Sync), Type)]> {
-        let params_ref = &self.parameters;
-        let types = self.types.clone();
-        let params_types = zip(params_ref, types);
+        let params_types = zip(&self.parameters, &self.types);
         params_types
-            .map(|(param, type_)| (param as &QueryParameter, type_))
+            .map(|(param, type_)| (param as &QueryParameter, type_.clone()))
             .collect::<Vec<(&QueryParameter, Type)>>()
             .into_boxed_slice()
     }
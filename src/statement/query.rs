@@ -85,3 +85,178 @@ impl ConvertedQueryString {
         &self.params_names
     }
 }
+
+/// Plain `INSERT ... VALUES (...)` query split around its values tuple.
+///
+/// It's used by `execute_many` to send many parameter sets
+/// as one multi-row `INSERT` instead of one statement per set.
+#[derive(Clone, Debug)]
+pub(crate) struct InsertValuesTemplate {
+    head: String,
+    row: String,
+    params_per_row: usize,
+}
+
+impl InsertValuesTemplate {
+    /// Split querystring into the part before the values tuple and the tuple itself.
+    ///
+    /// Return `None` if querystring isn't a single-row `INSERT ... VALUES (...)`
+    /// with only `$<number>` placeholders in the tuple,
+    /// for example if it has `RETURNING` or `ON CONFLICT` clause.
+    pub(crate) fn parse(querystring: &str, params_per_row: usize) -> Option<Self> {
+        let querystring = querystring.trim().trim_end_matches(';').trim_end();
+        if params_per_row == 0
+            || !querystring
+                .get(..6)
+                .is_some_and(|keyword| keyword.eq_ignore_ascii_case("INSERT"))
+        {
+            return None;
+        }
+
+        let values_idx = querystring.to_ascii_uppercase().rfind("VALUES")?;
+        let is_keyword = querystring[..values_idx]
+            .chars()
+            .next_back()
+            .is_some_and(|c| c.is_whitespace() || c == ')');
+        if !is_keyword {
+            return None;
+        }
+
+        let (head, row) = querystring.split_at(values_idx + "VALUES".len());
+        let row = row.trim();
+        if !row.starts_with('(') || !Self::is_single_tuple(row) {
+            return None;
+        }
+        if !Self::has_valid_placeholders(row, params_per_row) {
+            return None;
+        }
+
+        Some(Self {
+            head: head.to_string(),
+            row: row.to_string(),
+            params_per_row,
+        })
+    }
+
+    /// Maximum number of rows in one statement.
+    ///
+    /// `PostgreSQL` accepts at most `u16::MAX` parameters per statement.
+    pub(crate) fn rows_per_statement(&self) -> usize {
+        (usize::from(u16::MAX) / self.params_per_row).max(1)
+    }
+
+    /// Build querystring with `rows` values tuples and renumbered placeholders.
+    pub(crate) fn render(&self, rows: usize) -> String {
+        let mut querystring = String::with_capacity(self.head.len() + (self.row.len() + 8) * rows);
+        querystring.push_str(&self.head);
+
+        for row_idx in 0..rows {
+            querystring.push_str(if row_idx == 0 { " " } else { ", " });
+            self.push_row(&mut querystring, row_idx * self.params_per_row);
+        }
+
+        querystring
+    }
+
+    fn push_row(&self, querystring: &mut String, offset: usize) {
+        let mut chars = self.row.chars().peekable();
+        while let Some(c) = chars.next() {
+            querystring.push(c);
+            if c != '$' {
+                continue;
+            }
+
+            let mut number = String::new();
+            while let Some(digit) = chars.next_if(char::is_ascii_digit) {
+                number.push(digit);
+            }
+            if let Ok(param_idx) = number.parse::<usize>() {
+                querystring.push_str(&(param_idx + offset).to_string());
+            }
+        }
+    }
+
+    fn is_single_tuple(row: &str) -> bool {
+        let mut depth: usize = 0;
+        for (idx, c) in row.char_indices() {
+            match c {
+                '(' => depth += 1,
+                ')' => {
+                    depth = match depth.checked_sub(1) {
+                        Some(depth) => depth,
+                        None => return false,
+                    };
+                    if depth == 0 && idx != row.len() - 1 {
+                        return false;
+                    }
+                }
+                '\'' | '"' | ';' => return false,
+                _ => {}
+            }
+        }
+        depth == 0
+    }
+
+    fn has_valid_placeholders(row: &str, params_per_row: usize) -> bool {
+        let mut chars = row.chars().peekable();
+        while let Some(c) = chars.next() {
+            if c != '$' {
+                continue;
+            }
+
+            let mut number = String::new();
+            while let Some(digit) = chars.next_if(char::is_ascii_digit) {
+                number.push(digit);
+            }
+            match number.parse::<usize>() {
+                Ok(param_idx) if (1..=params_per_row).contains(&param_idx) => {}
+                _ => return false,
+            }
+        }
+        true
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::InsertValuesTemplate;
+
+    #[test]
+    fn insert_values_template_render() {
+        let template = InsertValuesTemplate::parse("INSERT INTO users VALUES ($1, $2)", 2).unwrap();
+        assert_eq!(
+            template.render(3),
+            "INSERT INTO users VALUES ($1, $2), ($3, $4), ($5, $6)"
+        );
+    }
+
+    #[test]
+    fn insert_values_template_keeps_casts() {
+        let template = InsertValuesTemplate::parse(
+            "insert into users (id, name) values ($1::int, lower($2));",
+            2,
+        )
+        .unwrap();
+        assert_eq!(
+            template.render(2),
+            "insert into users (id, name) values ($1::int, lower($2)), ($3::int, lower($4))"
+        );
+    }
+
+    #[test]
+    fn insert_values_template_rejects_other_queries() {
+        for querystring in [
+            "UPDATE users SET name = $1 WHERE id = $2",
+            "INSERT INTO users VALUES ($1, $2) RETURNING id",
+            "INSERT INTO users VALUES ($1, $2) ON CONFLICT DO NOTHING",
+            "INSERT INTO users VALUES ($1, $2), ($3, $4)",
+            "INSERT INTO users VALUES ($1, 'a$2')",
+            "INSERT INTO users SELECT $1, $2",
+        ] {
+            assert!(
+                InsertValuesTemplate::parse(querystring, 2).is_none(),
+                "{querystring}"
+            );
+        }
+    }
+}
@@ -1,10 +1,11 @@
 use postgres_types::{ToSql, Type};
+use pyo3::PyObject;
 use tokio_postgres::Statement;
 
 use crate::exceptions::rust_errors::{PSQLPyResult, RustPSQLDriverError};
 
 use super::{
-    parameters::{Column, PreparedParameters},
+    parameters::{Column, ParametersBuilder, PreparedParameters},
     query::QueryString,
 };
 
@@ -78,6 +79,27 @@ impl PsqlpyStatement {
             .map(|c| c.params_names().as_slice())
     }
 
+    /// Return the same statement bound to new parameters.
+    ///
+    /// Server-side statement is reused, only parameters are converted.
+    ///
+    /// # Errors
+    /// May return error if parameters cannot be converted.
+    pub fn bind(&self, parameters: &PyObject) -> PSQLPyResult<Self> {
+        let prepared_parameters = ParametersBuilder::new(
+            Some(parameters),
+            Some(self.param_types().to_vec()),
+            self.columns().clone(),
+        )
+        .prepare(self.param_names().map(<[_]>::to_vec))?;
+
+        Ok(Self {
+            query: self.query.clone(),
+            prepared_parameters,
+            prepared_statement: self.prepared_statement.clone(),
+        })
+    }
+
     #[must_use]
     pub fn into_prepared_parameters(self) -> PreparedParameters {
         self.prepared_parameters
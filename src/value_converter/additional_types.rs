@@ -7,7 +7,7 @@ use macaddr::{MacAddr6, MacAddr8};
 use postgres_protocol::types;
 use postgres_types::{to_sql_checked, IsNull, ToSql};
 use pyo3::{
-    types::{PyFloat, PyList, PyTuple},
+    types::{PyList, PyTuple},
     Bound, IntoPyObject, PyAny, Python,
 };
 use serde::{Deserialize, Serialize};
@@ -94,11 +94,7 @@ macro_rules! new_py_any_vec {
 }
 
 fn coord_to_pytuple_any<'py>(py: Python<'py>, coord: &Coord) -> PSQLPyResult<Bound<'py, PyAny>> {
-    let tuple_vec = vec![
-        coord.x.into_pyobject(py).unwrap(),
-        coord.y.into_pyobject(py).unwrap(),
-    ];
-    new_py_any_vec!(PyTuple, py, tuple_vec)
+    new_py_any_vec!(PyTuple, py, [coord.x, coord.y])
 }
 
 impl<'py> IntoPyObject<'py> for RustPoint {
@@ -120,11 +116,10 @@ impl<'py> IntoPyObject<'py> for RustRect {
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
         let inner_value = self.inner();
 
-        let mut result_vec: Vec<Bound<PyAny>> = vec![];
-        let coordinates = vec![inner_value.max(), inner_value.min()];
-        for one_coordinate in coordinates {
-            result_vec.push(coord_to_pytuple_any(py, &one_coordinate)?);
-        }
+        let result_vec = [
+            coord_to_pytuple_any(py, &inner_value.max())?,
+            coord_to_pytuple_any(py, &inner_value.min())?,
+        ];
         new_py_any_vec!(PyTuple, py, result_vec)
     }
 }
@@ -137,7 +132,7 @@ impl<'py> IntoPyObject<'py> for RustLineString {
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
         let inner_value = self.inner();
 
-        let mut result_vec: Vec<Bound<PyAny>> = vec![];
+        let mut result_vec: Vec<Bound<PyAny>> = Vec::with_capacity(inner_value.0.len());
         for coordinate in inner_value {
             result_vec.push(coord_to_pytuple_any(py, coordinate)?);
         }
@@ -157,10 +152,10 @@ impl<'py> IntoPyObject<'py> for RustLineSegment {
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
         let inner_value = self.inner();
 
-        let mut result_vec: Vec<Bound<PyAny>> = vec![];
-        for coordinate in [inner_value.start, inner_value.end] {
-            result_vec.push(coord_to_pytuple_any(py, &coordinate)?);
-        }
+        let result_vec = [
+            coord_to_pytuple_any(py, &inner_value.start)?,
+            coord_to_pytuple_any(py, &inner_value.end)?,
+        ];
         new_py_any_vec!(PyList, py, result_vec)
     }
 }
@@ -171,13 +166,7 @@ impl<'py> IntoPyObject<'py> for Line {
     type Error = RustPSQLDriverError;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        let result_vec: Vec<Bound<PyFloat>> = vec![
-            self.a().into_pyobject(py).unwrap(),
-            self.b().into_pyobject(py).unwrap(),
-            self.c().into_pyobject(py).unwrap(),
-        ];
-
-        new_py_any_vec!(PyTuple, py, result_vec)
+        new_py_any_vec!(PyTuple, py, [self.a(), self.b(), self.c()])
     }
 }
 
@@ -189,7 +178,7 @@ impl<'py> IntoPyObject<'py> for Circle {
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
         let center = self.center();
 
-        let result_vec: Vec<Bound<PyAny>> = vec![
+        let result_vec = [
             coord_to_pytuple_any(py, &center)?,
             self.radius().into_pyobject(py).unwrap().into_any(),
         ];
@@ -4,8 +4,9 @@ use chrono::{DateTime, FixedOffset, NaiveDate, NaiveDateTime, NaiveTime};
 use pg_interval::Interval;
 use postgres_types::Type;
 use pyo3::{
-    types::{PyAnyMethods, PyDateTime, PyDelta, PyDict},
-    Bound, PyAny,
+    intern,
+    types::{PyAnyMethods, PyDateTime, PyDelta, PyDict, PyTzInfoAccess},
+    Bound, PyAny, PyRef,
 };
 use rust_decimal::Decimal;
 use uuid::Uuid;
@@ -52,9 +53,16 @@ construct_simple_type_converter!(NaiveTime, PythonDTO::PyTime);
 
 impl ToPythonDTO for PyDateTime {
     fn to_python_dto(python_param: &pyo3::Bound<'_, PyAny>) -> PSQLPyResult<PythonDTO> {
-        let timestamp_tz = python_param.extract::<DateTime<FixedOffset>>();
-        if let Ok(pydatetime_tz) = timestamp_tz {
-            return Ok(PythonDTO::PyDateTimeTz(pydatetime_tz));
+        // Naive datetime can't be extracted as `DateTime<FixedOffset>`,
+        // there is no need to build the extraction error for it.
+        let is_naive = python_param
+            .downcast::<PyDateTime>()
+            .is_ok_and(|pydatetime| pydatetime.get_tzinfo().is_none());
+        if !is_naive {
+            let timestamp_tz = python_param.extract::<DateTime<FixedOffset>>();
+            if let Ok(pydatetime_tz) = timestamp_tz {
+                return Ok(PythonDTO::PyDateTimeTz(pydatetime_tz));
+            }
         }
 
         let timestamp_no_tz = python_param.extract::<NaiveDateTime>();
@@ -93,11 +101,16 @@ impl ToPythonDTO for PyDict {
     }
 }
 
+// The wrapper is borrowed instead of extracted by value, so the wrapper
+// struct itself isn't cloned. `inner()` still copies the payload once:
+// the Python object keeps its value and `PythonDTO` needs its own.
 macro_rules! construct_extra_type_converter {
     ($match_type:ty, $kind:path) => {
         impl ToPythonDTO for $match_type {
             fn to_python_dto(python_param: &Bound<'_, PyAny>) -> PSQLPyResult<PythonDTO> {
-                Ok($kind(python_param.extract::<$match_type>()?.inner()))
+                Ok($kind(
+                    python_param.extract::<PyRef<'_, $match_type>>()?.inner(),
+                ))
             }
         }
     };
@@ -136,10 +149,13 @@ impl ToPythonDTO for PythonDecimal {
 }
 
 impl ToPythonDTO for PythonUUID {
+    /// `uuid.UUID` keeps its value as 128-bit integer,
+    /// so it's taken as is without formatting and parsing the text form.
     fn to_python_dto(python_param: &pyo3::Bound<'_, PyAny>) -> PSQLPyResult<PythonDTO> {
-        Ok(PythonDTO::PyUUID(Uuid::parse_str(
-            python_param.str()?.extract::<&str>()?,
-        )?))
+        let uuid_int = python_param
+            .getattr(intern!(python_param.py(), "int"))?
+            .extract::<u128>()?;
+        Ok(PythonDTO::PyUUID(Uuid::from_u128(uuid_int)))
     }
 }
 
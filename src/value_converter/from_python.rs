@@ -281,8 +281,10 @@ pub fn from_python_typed(
         );
     }
 
-    if let Ok(converted_array) = from_python_array_typed(parameter) {
-        return Ok(converted_array);
+    if !is_builtin_scalar(parameter) {
+        if let Ok(converted_array) = from_python_array_typed(parameter) {
+            return Ok(converted_array);
+        }
     }
 
     match *type_ {
@@ -378,6 +380,17 @@ pub fn from_python_typed(
     )))
 }
 
+/// Check if parameter is exactly `int`, `float`, `str` or `bool`.
+///
+/// Such values can never be one of the `extra_types` array wrappers,
+/// so the typed path doesn't need to probe them against each array class.
+fn is_builtin_scalar(parameter: &pyo3::Bound<'_, PyAny>) -> bool {
+    parameter.is_exact_instance_of::<PyInt>()
+        || parameter.is_exact_instance_of::<PyString>()
+        || parameter.is_exact_instance_of::<PyFloat>()
+        || parameter.is_exact_instance_of::<PyBool>()
+}
+
 fn from_python_array_typed(parameter: &pyo3::Bound<'_, PyAny>) -> PSQLPyResult<PythonDTO> {
     if parameter.is_instance_of::<extra_types::BoolArray>() {
         return <extra_types::BoolArray as ToPythonDTO>::to_python_dto(parameter);
@@ -552,6 +565,7 @@ pub fn extract_datetime_from_python_object_attrs(
 /// May return Err Result if cannot convert at least one element.
 #[allow(clippy::cast_possible_truncation)]
 #[allow(clippy::cast_possible_wrap)]
+#[allow(clippy::cast_sign_loss)]
 pub fn py_sequence_into_postgres_array(
     parameter: &Bound<PyAny>,
     type_: &Type,
@@ -600,7 +614,13 @@ pub fn py_sequence_into_postgres_array(
         }
     }
 
-    let array_data = py_sequence_into_flat_vec(parameter, type_)?;
+    // All elements of a regular ARRAY are collected into one buffer,
+    // so it's allocated once with the size taken from the dimensions.
+    let elements_count = dimensions.iter().fold(1usize, |count, dimension| {
+        count.saturating_mul(dimension.len as usize)
+    });
+    let mut array_data = Vec::with_capacity(elements_count);
+    py_sequence_into_flat_vec(parameter, type_, &mut array_data)?;
     match postgres_array::Array::from_parts_no_panic(array_data, dimensions) {
         Ok(result_array) => Ok(result_array),
         Err(err) => Err(RustPSQLDriverError::PyToRustValueConversionError(format!(
@@ -611,23 +631,30 @@ pub fn py_sequence_into_postgres_array(
 
 /// Convert Sequence from Python (except String) into flat vec.
 ///
+/// Elements of the nested sequences are pushed into the same `final_vec`
+/// without creating intermediate vectors.
+///
 /// # Errors
 /// May return Err Result if cannot convert element into Rust one.
 pub fn py_sequence_into_flat_vec(
     parameter: &Bound<PyAny>,
     type_: &Type,
-) -> PSQLPyResult<Vec<PythonDTO>> {
+    final_vec: &mut Vec<PythonDTO>,
+) -> PSQLPyResult<()> {
     let py_seq = parameter.downcast::<PySequence>().map_err(|_| {
         RustPSQLDriverError::PyToRustValueConversionError(
             "PostgreSQL ARRAY type can be made only from python Sequence".into(),
         )
     })?;
 
-    let mut final_vec: Vec<PythonDTO> = vec![];
-
     for seq_elem in py_seq.try_iter()? {
         let ok_seq_elem = seq_elem?;
 
+        if let Some(number_dto) = plain_number_into_dto(&ok_seq_elem, type_)? {
+            final_vec.push(number_dto);
+            continue;
+        }
+
         // Check for the string because it's sequence too,
         // and in the most cases it should be array type, not new dimension.
         if ok_seq_elem.is_instance_of::<PyString>() {
@@ -638,14 +665,43 @@ pub fn py_sequence_into_flat_vec(
         let possible_next_seq = ok_seq_elem.downcast::<PySequence>();
 
         if let Ok(next_seq) = possible_next_seq {
-            let mut next_vec = py_sequence_into_flat_vec(next_seq, type_)?;
-            final_vec.append(&mut next_vec);
+            py_sequence_into_flat_vec(next_seq, type_, final_vec)?;
         } else {
             final_vec.push(from_python_typed(&ok_seq_elem, type_)?);
         }
     }
 
-    Ok(final_vec)
+    Ok(())
+}
+
+/// Convert plain python `int`/`float` array element into numeric `PythonDTO`.
+///
+/// Numeric arrays consist of plain numbers in the most cases,
+/// so there is no need to check every element against
+/// all extra types as `from_python_typed` does.
+/// Returns `None` if the element must go through `from_python_typed`.
+///
+/// # Errors
+/// May return Err Result if number doesn't fit into the type.
+fn plain_number_into_dto(
+    parameter: &Bound<PyAny>,
+    type_: &Type,
+) -> PSQLPyResult<Option<PythonDTO>> {
+    let is_int = parameter.is_exact_instance_of::<PyInt>();
+    if !is_int && !parameter.is_exact_instance_of::<PyFloat>() {
+        return Ok(None);
+    }
+
+    let number_dto = match *type_ {
+        Type::INT2 if is_int => <i16 as ToPythonDTO>::to_python_dto(parameter)?,
+        Type::INT4 if is_int => <i32 as ToPythonDTO>::to_python_dto(parameter)?,
+        Type::INT8 if is_int => <i64 as ToPythonDTO>::to_python_dto(parameter)?,
+        Type::FLOAT4 => <f32 as ToPythonDTO>::to_python_dto(parameter)?,
+        Type::FLOAT8 => <f64 as ToPythonDTO>::to_python_dto(parameter)?,
+        _ => return Ok(None),
+    };
+
+    Ok(Some(number_dto))
 }
 
 /// Convert two python parameters(x and y) to Coord from `geo_type`.
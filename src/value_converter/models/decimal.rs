@@ -1,5 +1,7 @@
+use std::fmt::{self, Write as _};
+
 use postgres_types::{FromSql, Type};
-use pyo3::{types::PyAnyMethods, Bound, IntoPyObject, IntoPyObjectExt, PyAny, Python};
+use pyo3::{types::PyAnyMethods, Bound, IntoPyObject, PyAny, Python};
 use rust_decimal::Decimal;
 
 use crate::{
@@ -9,22 +11,60 @@ use crate::{
 #[derive(Clone)]
 pub struct InnerDecimal(pub Decimal);
 
+/// Stack buffer for the text representation of `Decimal`.
+struct DecimalTextBuffer {
+    buffer: [u8; 64],
+    len: usize,
+}
+
+impl Default for DecimalTextBuffer {
+    fn default() -> Self {
+        Self {
+            buffer: [0; 64],
+            len: 0,
+        }
+    }
+}
+
+impl DecimalTextBuffer {
+    fn as_str(&self) -> &str {
+        // Only whole `&str`s are written into the buffer.
+        std::str::from_utf8(&self.buffer[..self.len]).unwrap_or_default()
+    }
+}
+
+impl fmt::Write for DecimalTextBuffer {
+    fn write_str(&mut self, s: &str) -> fmt::Result {
+        let end = self.len + s.len();
+        if end > self.buffer.len() {
+            return Err(fmt::Error);
+        }
+        self.buffer[self.len..end].copy_from_slice(s.as_bytes());
+        self.len = end;
+        Ok(())
+    }
+}
+
 impl<'py> IntoPyObject<'py> for InnerDecimal {
     type Target = PyAny;
     type Output = Bound<'py, Self::Target>;
     type Error = RustPSQLDriverError;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        let dec_cls = get_decimal_cls(py).expect("failed to load decimal.Decimal");
-        let ret = dec_cls
-            .call1((self.0.to_string(),))
-            .expect("failed to call decimal.Decimal(value)");
-        match ret.into_py_any(py) {
-            Ok(result) => Ok(result.bind(py).clone()),
-            Err(_) => Err(RustPSQLDriverError::RustToPyValueConversionError(
+        let dec_cls = get_decimal_cls(py)?;
+        // Text of any rust `Decimal` fits into the stack buffer,
+        // so there is no heap allocation for every value.
+        let mut buffer = DecimalTextBuffer::default();
+        let result = if write!(buffer, "{}", self.0).is_ok() {
+            dec_cls.call1((buffer.as_str(),))
+        } else {
+            dec_cls.call1((self.0.to_string(),))
+        };
+        result.map_err(|_| {
+            RustPSQLDriverError::RustToPyValueConversionError(
                 "Cannot convert Rust decimal to Python one".into(),
-            )),
-        }
+            )
+        })
     }
 }
 
@@ -11,8 +11,9 @@ use tokio_postgres::types::Type;
 use crate::{
     exceptions::rust_errors::{PSQLPyResult, RustPSQLDriverError},
     value_converter::{
-        dto::enums::PythonDTO, from_python::from_python_untyped,
-        to_python::build_python_from_serde_value,
+        dto::enums::PythonDTO,
+        from_python::from_python_untyped,
+        to_python::{build_python_from_serde_value, json_bytes_to_py},
     },
 };
 
@@ -57,6 +58,42 @@ impl<'a> FromSql<'a> for InternalSerdeValue {
     }
 }
 
+/// Struct for raw JSON/JSONB text from PostgreSQL.
+///
+/// Text is borrowed from the row buffer and converted
+/// into Python objects without building serde `Value`.
+pub struct InternalJsonBytes<'a>(&'a [u8]);
+
+impl<'py> IntoPyObject<'py> for InternalJsonBytes<'_> {
+    type Target = PyAny;
+    type Output = Bound<'py, Self::Target>;
+    type Error = RustPSQLDriverError;
+
+    fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
+        Ok(json_bytes_to_py(py, self.0)?.into_bound(py))
+    }
+}
+
+impl<'a> FromSql<'a> for InternalJsonBytes<'a> {
+    fn from_sql(
+        ty: &Type,
+        raw: &'a [u8],
+    ) -> Result<Self, Box<dyn std::error::Error + Sync + Send>> {
+        if *ty == Type::JSONB {
+            // JSONB is sent as version byte followed by JSON text.
+            return match raw.split_first() {
+                Some((1, json_bytes)) => Ok(InternalJsonBytes(json_bytes)),
+                _ => Err("unsupported JSONB encoding version".into()),
+            };
+        }
+        Ok(InternalJsonBytes(raw))
+    }
+
+    fn accepts(ty: &Type) -> bool {
+        matches!(*ty, Type::JSON | Type::JSONB)
+    }
+}
+
 fn serde_value_for_json_child(item: &Bound<'_, PyAny>) -> PSQLPyResult<Value> {
     if item.is_instance_of::<PyList>()
         || item.is_instance_of::<PyTuple>()
@@ -33,11 +33,15 @@ impl<'py> IntoPyObject<'py> for InternalUuid {
     type Error = RustPSQLDriverError;
 
     /// Performs the conversion.
+    ///
+    /// Hyphenated UUID is encoded into a stack buffer,
+    /// so no intermediate `String` is allocated.
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        match self.0.to_string().as_str().into_pyobject(py) {
-            Ok(result) => Ok(result),
-            _ => unreachable!(),
-        }
+        let mut buffer = Uuid::encode_buffer();
+        Ok(PyString::new(
+            py,
+            self.0.hyphenated().encode_lower(&mut buffer),
+        ))
     }
 }
 
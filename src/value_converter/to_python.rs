@@ -1,12 +1,12 @@
-use chrono::{self, DateTime, FixedOffset, NaiveDate, NaiveDateTime, NaiveTime};
+use chrono::{self, DateTime, NaiveDate, NaiveDateTime, NaiveTime, Utc};
 use pg_interval::Interval;
 use postgres_array::{Array, Dimension};
 use postgres_types::{Field, FromSql, Kind, Type};
 use rust_decimal::Decimal;
+use serde::de::{self, DeserializeSeed, Deserializer, MapAccess, SeqAccess, Visitor};
 use serde_json::Value;
-use std::net::IpAddr;
+use std::{fmt, net::IpAddr};
 use tokio_postgres::{Column, Row};
-use uuid::Uuid;
 
 use pyo3::{
     types::{PyAnyMethods, PyBytes, PyDict, PyDictMethods, PyList, PyListMethods, PyString},
@@ -22,19 +22,101 @@ use crate::{
         },
         models::{
             decimal::InnerDecimal, internal_char::InternalChar, interval::InnerInterval,
-            serde_value::InternalSerdeValue, uuid::InternalUuid,
+            serde_value::InternalJsonBytes, uuid::InternalUuid,
         },
     },
 };
 use pgvector::Vector as PgVector;
 
+/// Number of dimensions in the binary header of an empty ARRAY.
+const EMPTY_ARRAY_NDIM: [u8; 4] = 0i32.to_be_bytes();
+
+/// Deserialization seed that builds Python objects right from JSON text.
+///
+/// There is no intermediate serde `Value`, so objects and arrays
+/// are not allocated twice.
+struct PyJsonSeed<'py>(Python<'py>);
+
+impl<'de> DeserializeSeed<'de> for PyJsonSeed<'_> {
+    type Value = Py<PyAny>;
+
+    fn deserialize<D: Deserializer<'de>>(self, deserializer: D) -> Result<Self::Value, D::Error> {
+        deserializer.deserialize_any(self)
+    }
+}
+
+impl<'de> Visitor<'de> for PyJsonSeed<'_> {
+    type Value = Py<PyAny>;
+
+    fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+        formatter.write_str("any valid JSON value")
+    }
+
+    fn visit_bool<E: de::Error>(self, value: bool) -> Result<Self::Value, E> {
+        value.into_py_any(self.0).map_err(E::custom)
+    }
+
+    fn visit_i64<E: de::Error>(self, value: i64) -> Result<Self::Value, E> {
+        value.into_py_any(self.0).map_err(E::custom)
+    }
+
+    fn visit_u64<E: de::Error>(self, value: u64) -> Result<Self::Value, E> {
+        value.into_py_any(self.0).map_err(E::custom)
+    }
+
+    fn visit_f64<E: de::Error>(self, value: f64) -> Result<Self::Value, E> {
+        value.into_py_any(self.0).map_err(E::custom)
+    }
+
+    fn visit_str<E: de::Error>(self, value: &str) -> Result<Self::Value, E> {
+        Ok(PyString::new(self.0, value).into_any().unbind())
+    }
+
+    fn visit_unit<E: de::Error>(self) -> Result<Self::Value, E> {
+        Ok(self.0.None())
+    }
+
+    fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> Result<Self::Value, A::Error> {
+        let mut result_vec: Vec<Py<PyAny>> = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+        while let Some(element) = seq.next_element_seed(PyJsonSeed(self.0))? {
+            result_vec.push(element);
+        }
+        result_vec.into_py_any(self.0).map_err(de::Error::custom)
+    }
+
+    fn visit_map<A: MapAccess<'de>>(self, mut map: A) -> Result<Self::Value, A::Error> {
+        let py_dict = PyDict::new(self.0);
+        while let Some(key) = map.next_key_seed(PyJsonSeed(self.0))? {
+            let value = map.next_value_seed(PyJsonSeed(self.0))?;
+            py_dict.set_item(key, value).map_err(de::Error::custom)?;
+        }
+        Ok(py_dict.into_any().unbind())
+    }
+}
+
+/// Convert JSON text into Python object.
+///
+/// # Errors
+/// May return Err Result if JSON is not valid.
+pub fn json_bytes_to_py(py: Python<'_>, json_bytes: &[u8]) -> PSQLPyResult<Py<PyAny>> {
+    let mut deserializer = serde_json::Deserializer::from_slice(json_bytes);
+    PyJsonSeed(py)
+        .deserialize(&mut deserializer)
+        .and_then(|value| deserializer.end().map(|()| value))
+        .map_err(|err| {
+            RustPSQLDriverError::RustToPyValueConversionError(format!(
+                "Cannot convert JSON into Python object, err: {err}"
+            ))
+        })
+}
+
 /// Convert serde `Value` into Python object.
 /// # Errors
 /// May return Err Result if cannot add new value to Python Dict.
 pub fn build_python_from_serde_value(py: Python<'_>, value: Value) -> PSQLPyResult<Py<PyAny>> {
     match value {
         Value::Array(massive) => {
-            let mut result_vec: Vec<Py<PyAny>> = vec![];
+            let mut result_vec: Vec<Py<PyAny>> = Vec::with_capacity(massive.len());
 
             for single_record in massive {
                 result_vec.push(build_python_from_serde_value(py, single_record)?);
@@ -46,10 +128,7 @@ pub fn build_python_from_serde_value(py: Python<'_>, value: Value) -> PSQLPyResu
             let py_dict = PyDict::new(py);
 
             for (key, value) in mapping {
-                py_dict.set_item(
-                    build_python_from_serde_value(py, Value::String(key))?,
-                    build_python_from_serde_value(py, value)?,
-                )?;
+                py_dict.set_item(key, build_python_from_serde_value(py, value)?)?;
             }
             Ok(py_dict.into_py_any(py)?)
         }
@@ -90,76 +169,58 @@ fn composite_field_postgres_to_py<'a, T: FromSql<'a>>(
 /// Convert rust array to python list.
 ///
 /// It can convert multidimensional arrays.
-fn postgres_array_to_py<'py, T: IntoPyObject<'py> + Clone>(
+fn postgres_array_to_py<'py, T: IntoPyObject<'py>>(
     py: Python<'py>,
     array: Option<Array<T>>,
 ) -> Option<Py<PyList>> {
     array.map(|array| {
-        // Collect data once instead of creating copies in recursion
-        let data: Vec<T> = array.iter().cloned().collect();
-        inner_postgres_array_to_py(py, array.dimensions(), &data, 0, 0)
+        let dimensions = array.dimensions().to_vec();
+        // Take ownership of the decoded data instead of cloning every element.
+        let mut data = array.into_inner().into_iter();
+        inner_postgres_array_to_py(py, &dimensions, &mut data)
     })
 }
 
 /// Inner postgres array conversion to python list.
+///
+/// Elements are moved from the flat `data` iterator
+/// and every list is created with its final size,
+/// nested lists take their elements in row-major order.
 #[allow(clippy::cast_sign_loss)]
 fn inner_postgres_array_to_py<'py, T>(
     py: Python<'py>,
     dimensions: &[Dimension],
-    data: &[T],
-    dimension_index: usize,
-    data_offset: usize,
+    data: &mut std::vec::IntoIter<T>,
 ) -> Py<PyList>
 where
-    T: IntoPyObject<'py> + Clone,
+    T: IntoPyObject<'py>,
 {
-    // Check bounds early
-    if dimension_index >= dimensions.len() || data_offset >= data.len() {
+    let Some((current_dimension, inner_dimensions)) = dimensions.split_first() else {
         return PyList::empty(py).unbind();
-    }
-
-    let current_dimension = &dimensions[dimension_index];
+    };
     let current_len = current_dimension.len as usize;
 
     // If this is the last dimension, create a list with the actual data
-    if dimension_index + 1 >= dimensions.len() {
-        let end_offset = (data_offset + current_len).min(data.len());
-        let slice = &data[data_offset..end_offset];
-
-        // Create Python list more efficiently
-        return match PyList::new(py, slice.iter().cloned()) {
+    if inner_dimensions.is_empty() {
+        return match PyList::new(py, data.by_ref().take(current_len)) {
             Ok(list) => list.unbind(),
             Err(_) => PyList::empty(py).unbind(),
         };
     }
 
     // For multi-dimensional arrays, recursively create nested lists
-    let final_list = PyList::empty(py);
-
-    // Calculate the size of each sub-array
-    let sub_array_size = dimensions[dimension_index + 1..]
-        .iter()
-        .map(|d| d.len as usize)
-        .product::<usize>();
-
-    let mut current_offset = data_offset;
-
+    let mut inner_lists: Vec<Py<PyList>> = Vec::with_capacity(current_len);
     for _ in 0..current_len {
-        if current_offset >= data.len() {
+        if data.len() == 0 {
             break;
         }
-
-        let inner_list =
-            inner_postgres_array_to_py(py, dimensions, data, dimension_index + 1, current_offset);
-
-        if final_list.append(inner_list).is_err() {
-            break;
-        }
-
-        current_offset += sub_array_size;
+        inner_lists.push(inner_postgres_array_to_py(py, inner_dimensions, data));
     }
 
-    final_list.unbind()
+    match PyList::new(py, inner_lists) {
+        Ok(list) => list.unbind(),
+        Err(_) => PyList::empty(py).unbind(),
+    }
 }
 
 #[allow(clippy::too_many_lines)]
@@ -171,12 +232,11 @@ fn postgres_bytes_to_py(
 ) -> PSQLPyResult<Py<PyAny>> {
     match *type_ {
         // ---------- Bytes Types ----------
-        // Convert BYTEA type into Vector<u8>, then into PyBytes
+        // Convert BYTEA type into &[u8] borrowed from the row buffer, then into PyBytes
         Type::BYTEA => {
-            let vec_of_bytes =
-                composite_field_postgres_to_py::<Option<Vec<u8>>>(type_, buf, is_simple)?;
-            if let Some(vec_of_bytes) = vec_of_bytes {
-                return Ok(PyBytes::new(py, &vec_of_bytes).into_py_any(py)?);
+            let bytes = composite_field_postgres_to_py::<Option<&[u8]>>(type_, buf, is_simple)?;
+            if let Some(bytes) = bytes {
+                return Ok(PyBytes::new(py, bytes).into_py_any(py)?);
             }
             Ok(py.None())
         }
@@ -186,9 +246,9 @@ fn postgres_bytes_to_py(
         )?
         .into_py_any(py)?),
         // // ---------- String Types ----------
-        // // Convert TEXT and VARCHAR type into String, then into str
+        // // Convert TEXT and VARCHAR type into &str borrowed from the row buffer, then into str
         Type::TEXT | Type::VARCHAR | Type::XML | Type::NAME => Ok(
-            composite_field_postgres_to_py::<Option<String>>(type_, buf, is_simple)?
+            composite_field_postgres_to_py::<Option<&str>>(type_, buf, is_simple)?
                 .into_py_any(py)?,
         ),
         // Convert internal "char" (OID 18, single byte) into a one-character str.
@@ -241,34 +301,29 @@ fn postgres_bytes_to_py(
             type_, buf, is_simple,
         )?
         .into_py_any(py)?),
-        // Convert TIMESTAMP into NaiveDateTime, then into datetime.datetime
-        Type::TIMESTAMPTZ => Ok(
-            composite_field_postgres_to_py::<Option<DateTime<FixedOffset>>>(type_, buf, is_simple)?
-                .into_py_any(py)?,
-        ),
+        // Convert TIMESTAMPTZ into DateTime<Utc>, then into datetime.datetime.
+        // PostgreSQL sends TIMESTAMPTZ in UTC, and UTC tzinfo is a shared
+        // Python singleton, so no tzinfo object is created per value.
+        Type::TIMESTAMPTZ => Ok(composite_field_postgres_to_py::<Option<DateTime<Utc>>>(
+            type_, buf, is_simple,
+        )?
+        .into_py_any(py)?),
         // ---------- UUID Types ----------
-        // Convert UUID into Uuid type, then into String if possible
-        Type::UUID => {
-            let rust_uuid = composite_field_postgres_to_py::<Option<Uuid>>(type_, buf, is_simple)?;
-            match rust_uuid {
-                Some(rust_uuid) => Ok(PyString::new(py, &rust_uuid.to_string()).into_py_any(py)?),
-                None => Ok(py.None()),
-            }
-        }
+        // Convert UUID into InternalUuid type, then into String
+        Type::UUID => Ok(composite_field_postgres_to_py::<Option<InternalUuid>>(
+            type_, buf, is_simple,
+        )?
+        .into_py_any(py)?),
         // ---------- IpAddress Types ----------
         Type::INET => Ok(
             composite_field_postgres_to_py::<Option<IpAddr>>(type_, buf, is_simple)?
                 .into_py_any(py)?,
         ),
-        // Convert JSON/JSONB into Serde Value, then into list or dict
-        Type::JSONB | Type::JSON => {
-            let db_json = composite_field_postgres_to_py::<Option<Value>>(type_, buf, is_simple)?;
-
-            match db_json {
-                Some(value) => Ok(build_python_from_serde_value(py, value)?),
-                None => Ok(py.None().into_py_any(py)?),
-            }
-        }
+        // Convert JSON/JSONB text right into list or dict
+        Type::JSONB | Type::JSON => Ok(
+            composite_field_postgres_to_py::<Option<InternalJsonBytes>>(type_, buf, is_simple)?
+                .into_py_any(py)?,
+        ),
         // Convert MACADDR into inner type for macaddr6, then into str
         Type::MACADDR => {
             let macaddr_ =
@@ -368,10 +423,10 @@ fn postgres_bytes_to_py(
             composite_field_postgres_to_py::<Option<Array<i32>>>(type_, buf, is_simple)?,
         )
         .into_py_any(py)?),
-        // Convert ARRAY of TEXT or VARCHAR into Vec<String>, then into list[str]
+        // Convert ARRAY of TEXT or VARCHAR into Vec<&str>, then into list[str]
         Type::TEXT_ARRAY | Type::VARCHAR_ARRAY | Type::XML_ARRAY => Ok(postgres_array_to_py(
             py,
-            composite_field_postgres_to_py::<Option<Array<String>>>(type_, buf, is_simple)?,
+            composite_field_postgres_to_py::<Option<Array<&str>>>(type_, buf, is_simple)?,
         )
         .into_py_any(py)?),
         // Convert ARRAY of internal "char" into list[str] (each element is one byte).
@@ -423,12 +478,10 @@ fn postgres_bytes_to_py(
             composite_field_postgres_to_py::<Option<Array<NaiveDateTime>>>(type_, buf, is_simple)?,
         )
         .into_py_any(py)?),
-        // Convert ARRAY of TIMESTAMPTZ into Vec<DateTime<FixedOffset>>, then into list[datetime.date]
+        // Convert ARRAY of TIMESTAMPTZ into Vec<DateTime<Utc>>, then into list[datetime.date]
         Type::TIMESTAMPTZ_ARRAY => Ok(postgres_array_to_py(
             py,
-            composite_field_postgres_to_py::<Option<Array<DateTime<FixedOffset>>>>(
-                type_, buf, is_simple,
-            )?,
+            composite_field_postgres_to_py::<Option<Array<DateTime<Utc>>>>(type_, buf, is_simple)?,
         )
         .into_py_any(py)?),
         // Convert ARRAY of UUID into Vec<Array<InternalUuid>>, then into list[UUID]
@@ -445,7 +498,7 @@ fn postgres_bytes_to_py(
         )
         .into_py_any(py)?),
         Type::JSONB_ARRAY | Type::JSON_ARRAY => {
-            let db_json_array = composite_field_postgres_to_py::<Option<Array<InternalSerdeValue>>>(
+            let db_json_array = composite_field_postgres_to_py::<Option<Array<InternalJsonBytes>>>(
                 type_, buf, is_simple,
             )?;
             Ok(postgres_array_to_py(py, db_json_array).into_py_any(py)?)
@@ -572,13 +625,13 @@ pub fn composite_postgres_to_py(
         match field.type_().kind() {
             Kind::Simple | Kind::Array(_) => {
                 result_py_dict.set_item(
-                    field.name(),
+                    PyString::intern(py, field.name()),
                     postgres_bytes_to_py(py, field.type_(), buf, false)?,
                 )?;
             }
             Kind::Enum(_) => {
                 result_py_dict.set_item(
-                    field.name(),
+                    PyString::intern(py, field.name()),
                     postgres_bytes_to_py(py, &Type::VARCHAR, buf, false)?,
                 )?;
             }
@@ -586,7 +639,7 @@ pub fn composite_postgres_to_py(
                 let (_, tail) = buf.split_at(4_usize);
                 *buf = tail;
                 result_py_dict.set_item(
-                    field.name(),
+                    PyString::intern(py, field.name()),
                     raw_bytes_data_process(py, buf, field.name(), field.type_(), custom_decoders)?,
                 )?;
             }
@@ -609,19 +662,54 @@ pub fn raw_bytes_data_process(
     column_type: &Type,
     custom_decoders: &Option<Py<PyDict>>,
 ) -> PSQLPyResult<Py<PyAny>> {
-    if let Some(custom_decoders) = custom_decoders {
-        let py_encoder_func = custom_decoders
-            .bind(py)
-            .get_item(column_name.to_lowercase());
-
-        if let Ok(Some(py_encoder_func)) = py_encoder_func {
-            return Ok(py_encoder_func
-                .call1((PyBytes::new(py, raw_bytes_data),))?
-                .unbind());
-        }
+    if let Some(column_decoder) = column_custom_decoder(py, column_name, custom_decoders) {
+        return Ok(column_decoder
+            .call1((PyBytes::new(py, raw_bytes_data),))?
+            .unbind());
     }
 
+    raw_bytes_to_py(py, raw_bytes_data, column_type, custom_decoders)
+}
+
+/// Find custom decoder for the column.
+///
+/// Keys of `custom_decoders` are lowercase column names.
+#[must_use]
+pub fn column_custom_decoder<'py>(
+    py: Python<'py>,
+    column_name: &str,
+    custom_decoders: &Option<Py<PyDict>>,
+) -> Option<Bound<'py, PyAny>> {
+    custom_decoders.as_ref().and_then(|custom_decoders| {
+        custom_decoders
+            .bind(py)
+            .get_item(column_name.to_lowercase())
+            .ok()
+            .flatten()
+    })
+}
+
+/// Convert raw bytes from `PostgreSQL` by the type of the column.
+///
+/// `custom_decoders` are used only for the fields of composite types.
+///
+/// # Errors
+///
+/// May return Err Result if cannot convert postgres
+/// type into rust one.
+#[allow(clippy::ref_option)]
+fn raw_bytes_to_py(
+    py: Python<'_>,
+    raw_bytes_data: &mut &[u8],
+    column_type: &Type,
+    custom_decoders: &Option<Py<PyDict>>,
+) -> PSQLPyResult<Py<PyAny>> {
     match column_type.kind() {
+        // Empty ARRAY has zero dimensions in its header,
+        // there is nothing to decode.
+        Kind::Array(_) if raw_bytes_data.starts_with(&EMPTY_ARRAY_NDIM) => {
+            Ok(PyList::empty(py).into_any().unbind())
+        }
         Kind::Simple | Kind::Array(_) => {
             postgres_bytes_to_py(py, column_type, raw_bytes_data, true)
         }
@@ -660,3 +748,32 @@ pub fn postgres_to_py(
     }
     Ok(py.None())
 }
+
+/// Convert type from postgres to python type with already resolved custom decoder.
+///
+/// It's used when many rows with the same columns are converted,
+/// so custom decoder is looked up once per column, not once per value.
+///
+/// # Errors
+///
+/// May return Err Result if cannot convert postgres
+/// type into rust one.
+pub fn postgres_to_py_with_decoder(
+    py: Python<'_>,
+    row: &Row,
+    column: &Column,
+    column_i: usize,
+    column_decoder: Option<&Bound<'_, PyAny>>,
+    custom_decoders: &Option<Py<PyDict>>,
+) -> PSQLPyResult<Py<PyAny>> {
+    let Some(mut raw_bytes_data) = row.col_buffer(column_i) else {
+        return Ok(py.None());
+    };
+    if let Some(column_decoder) = column_decoder {
+        return Ok(column_decoder
+            .call1((PyBytes::new(py, raw_bytes_data),))?
+            .unbind());
+    }
+
+    raw_bytes_to_py(py, &mut raw_bytes_data, column.type_(), custom_decoders)
+}